@@ -1,14 +1,99 @@
 
+import copy
 import time
-import json
+import orjson
 import re
 import logging
 from selenium.webdriver.common.by import By
-from selenium.common.exceptions import NoSuchElementException, ElementClickInterceptedException
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import NoSuchElementException, ElementClickInterceptedException, TimeoutException
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+_EMPTY_LIST_JSON = "[]"
+
+# Frontend-friendly history structure, copied only once a tab actually has timeline rows
+_EMPTY_HISTORY_TEMPLATE = {
+    "events": [],
+    "total_events": 0,
+    "last_sale": None,
+    "last_rental": None,
+    "last_listing": None,
+    "events_by_type": {
+        "sale": [],
+        "rental": [],
+        "listing": [],
+        "other": []
+    }
+}
+
+# Timeline selectors shared by the in-browser pass and the text fallback, in priority order
+_TIMELINE_ITEM_SELECTORS = (
+    '.property-timeline__timeline--tab-content ul li',
+    '.property-timeline__timeline--tab-content li',
+    '.timeline--tab-content ul li',
+    '.timeline--tab-content li',
+    '[data-testid="timeline-item"]',
+    '.timeline-item'
+)
+_TIMELINE_DATE_SELECTORS = ('.date-circle .circle', '.date-circle', '.timeline-date', '.date', '[data-testid="timeline-date"]')
+_TIMELINE_DESC_SELECTORS = ('.prop-info .heading', '.prop-info .title', '.timeline-title', '.heading', '.title', '[data-testid="timeline-title"]')
+_TIMELINE_DETAIL_SELECTORS = ('.prop-info .details', '.timeline-details', '.details', '.info')
+_TIMELINE_ITEM_SEL = ", ".join(_TIMELINE_ITEM_SELECTORS)
+
+# Upper bound on waiting for a history tab's timeline; empty tabs use all of it
+TIMELINE_WAIT_TIMEOUT = 2
+
+# Fields copied from each extracted timeline row into its event
+_TIMELINE_EVENT_FIELDS = ("date", "description", "details")
+
+# Event type for each lower-cased timeline description; anything else is "other"
+_EVENT_TYPE_MAP = {
+    "sold": "sale",
+    "sale": "sale",
+    "rented": "rental",
+    "rental": "rental",
+    "lease": "rental",
+    "listed": "listing",
+    "listing": "listing"
+}
+
+# Returns {date, description, details, text} for every item matched by the first non-empty item selector.
+# Arguments: item, date, description and detail selector lists.
+_TIMELINE_ROWS_JS = """
+    const pick = (node, sels) => {
+        for (const s of sels) {
+            const el = node.querySelector(s);
+            if (el && el.innerText.trim()) return el.innerText.trim();
+        }
+        return '';
+    };
+    const pickAll = (node, sels) => {
+        for (const s of sels) {
+            const texts = Array.from(node.querySelectorAll(s)).map(d => d.innerText.trim()).filter(Boolean);
+            if (texts.length) return texts;
+        }
+        return [];
+    };
+    let items = [];
+    for (const s of arguments[0]) {
+        items = document.querySelectorAll(s);
+        if (items.length) break;
+    }
+    return Array.from(items).map(it => ({
+        date: pick(it, arguments[1]),
+        description: pick(it, arguments[2]),
+        details: pickAll(it, arguments[3]),
+        text: it.innerText.trim()
+    }));
+"""
+
+def _dumps(obj):
+    """Serialize obj to a JSON string with orjson (C implementation, compact output)."""
+    return orjson.dumps(obj).decode()
+
 def safe_get_text(driver, by, value, default=""):
     """Safely get text from an element, return default if not found."""
     try:
@@ -17,9 +102,58 @@ def safe_get_text(driver, by, value, default=""):
     except (NoSuchElementException, ElementClickInterceptedException):
         return default
 
+def activate_tab(driver, tab_element):
+    """Click a tab unless it is already the selected one, and return whether it was clicked."""
+    return driver.execute_script("""
+        const tab = arguments[0];
+        if (tab.getAttribute('aria-selected') === 'true' || tab.classList.contains('active') || tab.classList.contains('selected')) {
+            return false;
+        }
+        tab.click();
+        return true;
+    """, tab_element)
+
+def timeline_ready(previous_item):
+    """Expected condition: the previous tab's timeline has been replaced and new items are present."""
+    def condition(driver):
+        if previous_item is not None and not EC.staleness_of(previous_item)(driver):
+            return False
+        return bool(driver.find_elements(By.CSS_SELECTOR, _TIMELINE_ITEM_SEL))
+    return condition
+
+def history_text_items(timeline_rows):
+    """Yield the fallback text for each timeline row: "date: description (details)" or the item's full text."""
+    for row in timeline_rows:
+        date_text = row.get("date", "")
+        desc_text = row.get("description", "")
+        if date_text or desc_text:
+            history_item = f"{date_text}: {desc_text}" if date_text and desc_text else (date_text or desc_text)
+            if row.get("details"):
+                history_item += f" ({'; '.join(row['details'])})"
+            yield history_item
+        elif row.get("text"):
+            yield row["text"]
+
 def extract_comprehensive_property_data(driver, url):
-    """Extract comprehensive property data from the current page using all available tabs and sections."""
-    logger.info(f"🔍 Extracting comprehensive property data from: {url}")
+    """Extract comprehensive property data from the current page using all available tabs and sections.
+
+    The driver's implicit wait is set to 0 for the duration of the extraction and restored afterwards.
+    Every lookup here runs after a tab switch and its wait, or is optional, so a missing element
+    should fail immediately instead of blocking for the implicit-wait timeout.
+    """
+    try:
+        previous_implicit_wait = driver.timeouts.implicit_wait
+    except Exception:
+        previous_implicit_wait = 0
+    driver.implicitly_wait(0)
+    try:
+        return _extract_comprehensive_property_data(driver, url)
+    finally:
+        driver.implicitly_wait(previous_implicit_wait)
+
+def _extract_comprehensive_property_data(driver, url):
+    """Body of extract_comprehensive_property_data, run with implicit waits disabled."""
+    logger.info("🔍 Extracting comprehensive property data from: %s", url)
     
     try:
         # Initialize comprehensive property data structure
@@ -85,9 +219,9 @@ def extract_comprehensive_property_data(driver, url):
                 address = address[:-4].strip()
             
             property_data['Address'] = address
-            logger.info(f"  ✅ Address extracted: {address}")
+            logger.info("  ✅ Address extracted: %s", address)
         except Exception as e:
-            logger.error(f"  ❌ Address extraction failed: {e}")
+            logger.error("  ❌ Address extraction failed: %s", e)
         
         # Extract property attributes
         property_attributes = {}
@@ -168,7 +302,7 @@ def extract_comprehensive_property_data(driver, url):
             property_attributes['floor_area'] = '-'
         
         # Store property attributes as JSON
-        property_data['Property_Attributes_JSON'] = json.dumps(property_attributes)
+        property_data['Property_Attributes_JSON'] = _dumps(property_attributes)
         
         # Extract property type
         property_type = safe_get_text(driver, By.ID, "attr-property-type")
@@ -190,7 +324,7 @@ def extract_comprehensive_property_data(driver, url):
                 property_data['Last_Sold_Date'] = date_match.group(1)
             
             if sale_data:
-                property_data['Sale_Information_JSON'] = json.dumps(sale_data)
+                property_data['Sale_Information_JSON'] = _dumps(sale_data)
         except:
             pass
         
@@ -252,23 +386,23 @@ def extract_comprehensive_property_data(driver, url):
                     else:
                         logger.info("  ℹ️ No 'Show More' link found - content may already be expanded")
                 except Exception as show_more_error:
-                    logger.info(f"  ℹ️ Could not find or click 'Show More' link: {show_more_error}")
+                    logger.info("  ℹ️ Could not find or click 'Show More' link: %s", show_more_error)
                 
                 # Find all advertiser lists
                 advertiser_lists = driver.find_elements(By.CSS_SELECTOR, '[data-testid="listing-description-panel"] .advertiser-list')
-                logger.info(f"  🔍 Found {len(advertiser_lists)} advertiser lists")
+                logger.info("  🔍 Found %d advertiser lists", len(advertiser_lists))
                 
                 for i, advertiser_list in enumerate(advertiser_lists):
                     try:
                         agent_info = {}
-                        logger.info(f"  🔍 Processing advertiser list {i+1}")
+                        logger.info("  🔍 Processing advertiser list %d", i + 1)
                         
                         # Extract agency - try multiple approaches
                         try:
                             # Method 1: Look for the specific structure (attr-value is sibling, not following-sibling)
                             agency_elem = advertiser_list.find_element(By.XPATH, './/span[@class="attr-label" and contains(text(), "Advertising Agency")]/../span[@class="attr-value"]')
                             agent_info['advertising_agency'] = agency_elem.text.strip()
-                            logger.info(f"    ✅ Agency found: {agent_info['advertising_agency']}")
+                            logger.info("    ✅ Agency found: %s", agent_info['advertising_agency'])
                         except:
                             # Method 2: Look for any span with "Advertising Agency" text
                             try:
@@ -279,7 +413,7 @@ def extract_comprehensive_property_data(driver, url):
                                         parent_p = span.find_element(By.XPATH, '..')
                                         value_span = parent_p.find_element(By.XPATH, './/span[@class="attr-value"]')
                                         agent_info['advertising_agency'] = value_span.text.strip()
-                                        logger.info(f"    ✅ Agency found (method 2): {agent_info['advertising_agency']}")
+                                        logger.info("    ✅ Agency found (method 2): %s", agent_info['advertising_agency'])
                                         break
                                     except:
                                         continue
@@ -290,7 +424,7 @@ def extract_comprehensive_property_data(driver, url):
                         try:
                             agent_elem = advertiser_list.find_element(By.XPATH, './/span[@class="attr-label" and contains(text(), "Advertising Agent")]/../span[@class="attr-value"]')
                             agent_info['advertising_agent'] = agent_elem.text.strip()
-                            logger.info(f"    ✅ Agent found: {agent_info['advertising_agent']}")
+                            logger.info("    ✅ Agent found: %s", agent_info['advertising_agent'])
                         except:
                             try:
                                 agent_spans = advertiser_list.find_elements(By.XPATH, './/span[contains(text(), "Advertising Agent")]')
@@ -300,7 +434,7 @@ def extract_comprehensive_property_data(driver, url):
                                         parent_p = span.find_element(By.XPATH, '..')
                                         value_span = parent_p.find_element(By.XPATH, './/span[@class="attr-value"]')
                                         agent_info['advertising_agent'] = value_span.text.strip()
-                                        logger.info(f"    ✅ Agent found (method 2): {agent_info['advertising_agent']}")
+                                        logger.info("    ✅ Agent found (method 2): %s", agent_info['advertising_agent'])
                                         break
                                     except:
                                         continue
@@ -311,7 +445,7 @@ def extract_comprehensive_property_data(driver, url):
                         try:
                             phone_elem = advertiser_list.find_element(By.XPATH, './/span[@class="attr-label" and contains(text(), "Agent Phone Number")]/../span[@class="attr-value"]')
                             agent_info['agent_phone'] = phone_elem.text.strip()
-                            logger.info(f"    ✅ Phone found: {agent_info['agent_phone']}")
+                            logger.info("    ✅ Phone found: %s", agent_info['agent_phone'])
                         except:
                             try:
                                 phone_spans = advertiser_list.find_elements(By.XPATH, './/span[contains(text(), "Agent Phone Number")]')
@@ -321,7 +455,7 @@ def extract_comprehensive_property_data(driver, url):
                                         parent_p = span.find_element(By.XPATH, '..')
                                         value_span = parent_p.find_element(By.XPATH, './/span[@class="attr-value"]')
                                         agent_info['agent_phone'] = value_span.text.strip()
-                                        logger.info(f"    ✅ Phone found (method 2): {agent_info['agent_phone']}")
+                                        logger.info("    ✅ Phone found (method 2): %s", agent_info['agent_phone'])
                                         break
                                     except:
                                         continue
@@ -330,18 +464,18 @@ def extract_comprehensive_property_data(driver, url):
                         
                         if agent_info:
                             agents_data.append(agent_info)
-                            logger.info(f"    ✅ Agent info added: {agent_info}")
+                            logger.info("    ✅ Agent info added: %s", agent_info)
                         else:
-                            logger.warning(f"    ⚠️ No agent info found in advertiser list {i+1}")
+                            logger.warning("    ⚠️ No agent info found in advertiser list %d", i + 1)
                             
                     except Exception as agent_error:
-                        logger.error(f"  ⚠️ Error extracting agent info from list {i+1}: {agent_error}")
+                        logger.error("  ⚠️ Error extracting agent info from list %d: %s", i + 1, agent_error)
                         continue
                 
                 # Store agents data as JSON
                 if agents_data:
-                    property_data['Advertising_Agent_Info_JSON'] = json.dumps(agents_data)
-                    logger.info(f"  ✅ Stored {len(agents_data)} agents in JSON")
+                    property_data['Advertising_Agent_Info_JSON'] = _dumps(agents_data)
+                    logger.info("  ✅ Stored %d agents in JSON", len(agents_data))
                     
                     # Also store first agent info in individual fields for backward compatibility
                     if len(agents_data) > 0:
@@ -349,15 +483,15 @@ def extract_comprehensive_property_data(driver, url):
                         property_data['Advertising_Agency'] = first_agent.get('advertising_agency', '')
                         property_data['Advertising_Agent'] = first_agent.get('advertising_agent', '')
                         property_data['Agent_Phone'] = first_agent.get('agent_phone', '')
-                        logger.info(f"  ✅ First agent stored: {first_agent}")
+                        logger.info("  ✅ First agent stored: %s", first_agent)
                 else:
-                    logger.warning(f"  ⚠️ No advertising agent data found")
+                    logger.warning("  ⚠️ No advertising agent data found")
                 
             except Exception as e:
-                logger.error(f"  ⚠️ Error extracting advertising agent information: {e}")
+                logger.error("  ⚠️ Error extracting advertising agent information: %s", e)
                 
         except Exception as e:
-            logger.error(f"  ⚠️ Error extracting listing description: {e}")
+            logger.error("  ⚠️ Error extracting listing description: %s", e)
         
         # Extract Natural Risks with comprehensive method
         try:
@@ -422,11 +556,22 @@ def extract_comprehensive_property_data(driver, url):
                     natural_risks_data["error"] = False
             
             property_data['Natural_Risks'] = natural_risks_data["summary"]
-            property_data['Natural_Risks_JSON'] = json.dumps(natural_risks_data)
+            property_data['Natural_Risks_JSON'] = _dumps(natural_risks_data)
         except Exception as e:
             property_data['Natural_Risks'] = 'Not available'
             property_data['Natural_Risks_JSON'] = '{}'
         
+        # Collect the crux tab menus present on this page once so missing tabs can be skipped
+        # without paying a failed lookup for each of them
+        try:
+            available_tabs = set(driver.execute_script(
+                "return Array.from(document.querySelectorAll('[data-testid^=\"crux-tab-menu-\"]'))"
+                ".map(e => e.getAttribute('data-testid').replace('crux-tab-menu-', ''));"
+            ) or [])
+        except Exception as e:
+            logger.error("  ⚠️ Could not collect available tabs: %s", e)
+            available_tabs = None
+        
         # Extract Additional Information - Legal Description, Property Features, Land Values (using sales_scraping.py method)
         try:
             additional_tabs = {
@@ -436,12 +581,16 @@ def extract_comprehensive_property_data(driver, url):
             }
             
             for tab_name, column_name in additional_tabs.items():
+                if available_tabs is not None and tab_name not in available_tabs:
+                    property_data[column_name] = 'Tab not available'
+                    continue
+                
                 try:
                     # Try to click on the specific tab
                     tab_element = driver.find_element(By.CSS_SELECTOR, f'[data-testid="crux-tab-menu-{tab_name}"]')
                     if tab_element and tab_element.is_enabled():
-                        driver.execute_script("arguments[0].click();", tab_element)
-                        time.sleep(3)  # Wait for content to load
+                        if activate_tab(driver, tab_element):
+                            time.sleep(3)  # Wait for content to load
                         
                         # Extract structured data based on tab type
                         if tab_name == 'Legal Description':
@@ -467,10 +616,10 @@ def extract_comprehensive_property_data(driver, url):
                                         legal_data[label] = content
                                         
                                 except Exception as row_error:
-                                    logger.error(f"  ⚠️ Error extracting legal row: {row_error}")
+                                    logger.error("  ⚠️ Error extracting legal row: %s", row_error)
                                     continue
                             
-                            content = json.dumps(legal_data) if legal_data else "{}"
+                            content = _dumps(legal_data) if legal_data else "{}"
                             
                         elif tab_name == 'Property Features':
                             # Extract property features data
@@ -491,7 +640,7 @@ def extract_comprehensive_property_data(driver, url):
                                     rows = driver.find_elements(By.CSS_SELECTOR, selector)
                                     if rows:
                                         feature_rows = rows
-                                        logger.info(f"  🔍 Found {len(rows)} feature rows with selector: {selector}")
+                                        logger.info("  🔍 Found %d feature rows with selector: %s", len(rows), selector)
                                         break
                                 except:
                                     continue
@@ -514,7 +663,7 @@ def extract_comprehensive_property_data(driver, url):
                                         except:
                                             continue
                                 except Exception as fallback_error:
-                                    logger.error(f"  ⚠️ Fallback extraction failed: {fallback_error}")
+                                    logger.error("  ⚠️ Fallback extraction failed: %s", fallback_error)
                             
                             for row in feature_rows:
                                 try:
@@ -547,10 +696,10 @@ def extract_comprehensive_property_data(driver, url):
                                         features_data[label] = content
                                         
                                 except Exception as row_error:
-                                    logger.error(f"  ⚠️ Error extracting feature row: {row_error}")
+                                    logger.error("  ⚠️ Error extracting feature row: %s", row_error)
                                     continue
                             
-                            content = json.dumps(features_data) if features_data else "{}"
+                            content = _dumps(features_data) if features_data else "{}"
                             
                         elif tab_name == 'Land Values':
                             # Extract land values data
@@ -571,7 +720,7 @@ def extract_comprehensive_property_data(driver, url):
                                     rows = driver.find_elements(By.CSS_SELECTOR, selector)
                                     if rows:
                                         value_rows = rows
-                                        logger.info(f"  🔍 Found {len(rows)} value rows with selector: {selector}")
+                                        logger.info("  🔍 Found %d value rows with selector: %s", len(rows), selector)
                                         break
                                 except:
                                     continue
@@ -594,7 +743,7 @@ def extract_comprehensive_property_data(driver, url):
                                         except:
                                             continue
                                 except Exception as fallback_error:
-                                    logger.error(f"  ⚠️ Fallback extraction failed: {fallback_error}")
+                                    logger.error("  ⚠️ Fallback extraction failed: %s", fallback_error)
                             
                             for row in value_rows:
                                 try:
@@ -627,21 +776,21 @@ def extract_comprehensive_property_data(driver, url):
                                         values_data[label] = content
                                         
                                 except Exception as row_error:
-                                    logger.error(f"  ⚠️ Error extracting value row: {row_error}")
+                                    logger.error("  ⚠️ Error extracting value row: %s", row_error)
                                     continue
                             
-                            content = json.dumps(values_data) if values_data else "{}"
+                            content = _dumps(values_data) if values_data else "{}"
                         
                         property_data[column_name] = content if content != "{}" else 'Not available'
-                        logger.info(f"  ✅ {tab_name} extracted: {len(content)} characters")
+                        logger.info("  ✅ %s extracted: %d characters", tab_name, len(content))
                     else:
                         property_data[column_name] = 'Tab not available'
-                        logger.warning(f"  ⚠️ {tab_name} tab not available")
+                        logger.warning("  ⚠️ %s tab not available", tab_name)
                 except Exception as e:
                     property_data[column_name] = 'Not available'
-                    logger.error(f"  ❌ {tab_name} extraction failed: {e}")
+                    logger.error("  ❌ %s extraction failed: %s", tab_name, e)
         except Exception as e:
-            logger.error(f"  ❌ Additional information extraction failed: {e}")
+            logger.error("  ❌ Additional information extraction failed: %s", e)
         
         # Extract Household Information
         try:
@@ -649,7 +798,7 @@ def extract_comprehensive_property_data(driver, url):
             property_data['Owner_Name'] = ''
             property_data['Current_Tenure'] = ''
             property_data['Owner_Type'] = ''
-            property_data['Marketing_Contacts_JSON'] = json.dumps([])
+            property_data['Marketing_Contacts_JSON'] = _EMPTY_LIST_JSON
             
             household_tabs = {
                 'Owner Information': 'Household_Information_Owner_Information',
@@ -657,11 +806,15 @@ def extract_comprehensive_property_data(driver, url):
             }
             
             for tab_name, column_name in household_tabs.items():
+                if available_tabs is not None and tab_name not in available_tabs:
+                    property_data[column_name] = 'Tab not available'
+                    continue
+                
                 try:
                     tab_element = driver.find_element(By.CSS_SELECTOR, f'[data-testid="crux-tab-menu-{tab_name}"]')
                     if tab_element and tab_element.is_enabled():
-                        driver.execute_script("arguments[0].click();", tab_element)
-                        time.sleep(2)
+                        if activate_tab(driver, tab_element):
+                            time.sleep(2)
                         
                         # Extract structured household information
                         household_data = {}
@@ -669,23 +822,18 @@ def extract_comprehensive_property_data(driver, url):
                         if tab_name == 'Owner Information':
                             # Extract owner information fields
                             try:
-                                # Extract Name - look for the span containing "Withheld" or actual name
+                                # Extract Name - the span containing "Withheld" or the actual name, falling
+                                # back to any span nested in a later sibling of the label, in one round-trip
                                 try:
-                                    name_elem = driver.find_element(By.CSS_SELECTOR, '.owner-name-label + span span')
-                                    name_text = name_elem.text.strip()
+                                    name_text = driver.execute_script(
+                                        "const e = document.querySelector('.owner-name-label + span span')"
+                                        " || document.querySelector('.owner-name-label ~ span span');"
+                                        " return e ? e.innerText.trim() : '';"
+                                    )
                                     if name_text:
                                         household_data['Name'] = name_text
                                 except:
-                                    # Fallback: look for any span after the name label
-                                    try:
-                                        name_elem = driver.find_element(By.CSS_SELECTOR, '.owner-name-label')
-                                        # Get the next sibling span that contains the name
-                                        name_span = name_elem.find_element(By.XPATH, 'following-sibling::span//span')
-                                        name_text = name_span.text.strip()
-                                        if name_text:
-                                            household_data['Name'] = name_text
-                                    except:
-                                        pass
+                                    pass
                                 
                                 # Extract Current Tenure - look for the tenure text
                                 try:
@@ -706,34 +854,28 @@ def extract_comprehensive_property_data(driver, url):
                                     pass
                                 
                             except Exception as e:
-                                logger.error(f"  ⚠️ Error extracting owner information: {e}")
+                                logger.error("  ⚠️ Error extracting owner information: %s", e)
                         
                         elif tab_name == 'Marketing Contacts':
                             # Extract marketing contacts
                             try:
-                                # Look for any contact information in the marketing contacts tab
-                                contact_elements = driver.find_elements(By.CSS_SELECTOR, '.tab-content p, .tab-content div')
-                                contact_info = []
-                                
-                                for elem in contact_elements:
-                                    try:
-                                        text = elem.text.strip()
-                                        if text and text not in ['Marketing Contacts', '']:
-                                            contact_info.append(text)
-                                    except:
-                                        continue
+                                # Collect the contact text in the browser, skipping blanks and the panel heading
+                                contact_info = driver.execute_script(
+                                    "return Array.from(document.querySelectorAll('.tab-content p, .tab-content div'))"
+                                    ".map(e => e.innerText.trim()).filter(t => t && t !== 'Marketing Contacts');"
+                                ) or []
                                 
                                 if contact_info:
                                     household_data['Contacts'] = contact_info
                                     
                             except Exception as e:
-                                logger.error(f"  ⚠️ Error extracting marketing contacts: {e}")
+                                logger.error("  ⚠️ Error extracting marketing contacts: %s", e)
                         
                         # Store the extracted data
                         if household_data:
-                            content = json.dumps(household_data)
+                            content = _dumps(household_data)
                             property_data[column_name] = content
-                            logger.info(f"  ✅ {tab_name} extracted: {len(household_data)} fields")
+                            logger.info("  ✅ %s extracted: %d fields", tab_name, len(household_data))
                             
                             # Also store individual fields for database compatibility
                             if tab_name == 'Owner Information':
@@ -744,22 +886,22 @@ def extract_comprehensive_property_data(driver, url):
                                 property_data['Marketing_Contacts_JSON'] = content
                         else:
                             property_data[column_name] = 'No data available'
-                            logger.warning(f"  ⚠️ {tab_name} - no data found")
+                            logger.warning("  ⚠️ %s - no data found", tab_name)
                             
                     else:
                         property_data[column_name] = 'Tab not available'
-                        logger.warning(f"  ⚠️ {tab_name} tab not available")
+                        logger.warning("  ⚠️ %s tab not available", tab_name)
                 except Exception as e:
                     property_data[column_name] = 'Not available'
-                    logger.error(f"  ❌ {tab_name} extraction failed: {e}")
+                    logger.error("  ❌ %s extraction failed: %s", tab_name, e)
         except Exception as e:
-            logger.error(f"  ❌ Household information extraction failed: {e}")
+            logger.error("  ❌ Household information extraction failed: %s", e)
             property_data['Household_Information_Owner_Information'] = 'Not available'
             property_data['Household_Information_Marketing_Contacts'] = 'Not available'
             property_data['Owner_Name'] = ''
             property_data['Current_Tenure'] = ''
             property_data['Owner_Type'] = ''
-            property_data['Marketing_Contacts_JSON'] = json.dumps([])
+            property_data['Marketing_Contacts_JSON'] = _EMPTY_LIST_JSON
         
         # Extract Valuation Estimates
         try:
@@ -769,11 +911,15 @@ def extract_comprehensive_property_data(driver, url):
             }
             
             for tab_name, column_name in valuation_tabs.items():
+                if available_tabs is not None and tab_name not in available_tabs:
+                    property_data[column_name] = 'Tab not available'
+                    continue
+                
                 try:
                     tab_element = driver.find_element(By.CSS_SELECTOR, f'[data-testid="crux-tab-menu-{tab_name}"]')
                     if tab_element and tab_element.is_enabled():
-                        driver.execute_script("arguments[0].click();", tab_element)
-                        time.sleep(2)
+                        if activate_tab(driver, tab_element):
+                            time.sleep(2)
                         
                         error_content = safe_get_text(driver, By.CSS_SELECTOR, '[data-testid="avm-detail"] .error-fetching span')
                         if error_content:
@@ -808,7 +954,7 @@ def extract_comprehensive_property_data(driver, url):
                                     property_data[column_name] = " | ".join(summary_parts)
                                     
                                     if valuation_data:
-                                        property_data[f'{column_name}_JSON'] = json.dumps(valuation_data)
+                                        property_data[f'{column_name}_JSON'] = _dumps(valuation_data)
                                 else:
                                     content = safe_get_text(driver, By.CSS_SELECTOR, '[data-testid="avm-detail"]')
                                     property_data[column_name] = content if content else 'Not available'
@@ -853,7 +999,7 @@ def extract_comprehensive_property_data(driver, url):
                                     property_data[column_name] = " | ".join(summary_parts)
                                     
                                     if rental_data:
-                                        property_data[f'{column_name}_JSON'] = json.dumps(rental_data)
+                                        property_data[f'{column_name}_JSON'] = _dumps(rental_data)
                                 else:
                                     content = safe_get_text(driver, By.CSS_SELECTOR, '[data-testid="avm-detail"]')
                                     property_data[column_name] = content if content else 'Not available'
@@ -862,7 +1008,7 @@ def extract_comprehensive_property_data(driver, url):
                 except Exception as e:
                     property_data[column_name] = 'Not available'
         except Exception as e:
-            logger.error(f"  ❌ Valuation estimate extraction failed: {e}")
+            logger.error("  ❌ Valuation estimate extraction failed: %s", e)
         
         # Extract Nearby Schools
         try:
@@ -872,11 +1018,15 @@ def extract_comprehensive_property_data(driver, url):
             }
             
             for tab_name, column_name in schools_tabs.items():
+                if available_tabs is not None and tab_name not in available_tabs:
+                    property_data[column_name] = 'Tab not available'
+                    continue
+                
                 try:
                     tab_element = driver.find_element(By.CSS_SELECTOR, f'[data-testid="crux-tab-menu-{tab_name}"]')
                     if tab_element and tab_element.is_enabled():
-                        driver.execute_script("arguments[0].click();", tab_element)
-                        time.sleep(3)
+                        if activate_tab(driver, tab_element):
+                            time.sleep(3)
                         
                         error_content = safe_get_text(driver, By.CSS_SELECTOR, '[data-testid="nearby-school-panel"] .error-fetching span')
                         if error_content:
@@ -959,13 +1109,13 @@ def extract_comprehensive_property_data(driver, url):
                                 except Exception as school_error:
                                     continue
                             
-                            property_data[column_name] = json.dumps(schools_data) if schools_data else "[]"
+                            property_data[column_name] = _dumps(schools_data) if schools_data else _EMPTY_LIST_JSON
                     else:
                         property_data[column_name] = 'Tab not available'
                 except Exception as e:
                     property_data[column_name] = 'Not available'
         except Exception as e:
-            logger.error(f"  ❌ Nearby schools extraction failed: {e}")
+            logger.error("  ❌ Nearby schools extraction failed: %s", e)
         
         # Extract Property History using the same method as sales_scraping.py
         try:
@@ -988,203 +1138,92 @@ def extract_comprehensive_property_data(driver, url):
                         f"//div[contains(@class, 'timeline--tab') and contains(text(), '{tab_name}')]"
                     ]
                     
-                    for selector in tab_selectors:
-                        try:
-                            tab_element = driver.find_element(By.XPATH, selector)
-                            if tab_element and tab_element.is_displayed():
-                                logger.info(f"✅ Found {tab_name} tab with selector: {selector}")
-                                break
-                        except:
-                            continue
+                    # One query for the union of all variants; find_elements returns [] instead of
+                    # raising, so misses no longer cost an exception per selector
+                    tab_candidates = driver.find_elements(By.XPATH, " | ".join(tab_selectors))
+                    for candidate in tab_candidates:
+                        if candidate.is_displayed():
+                            tab_element = candidate
+                            logger.info("✅ Found %s tab", tab_name)
+                            break
+                    else:
+                        if tab_candidates:
+                            tab_element = tab_candidates[0]
                     
                     if not tab_element:
-                        logger.warning(f"❌ Could not find {tab_name} tab with any selector")
+                        logger.warning("❌ Could not find %s tab with any selector", tab_name)
                         property_data[column_name] = 'Tab not found'
                         continue
                     
                     if tab_element.is_enabled():
-                        driver.execute_script("arguments[0].click();", tab_element)
-                        time.sleep(2)  # Wait for content to load
-                        
-                        # Use frontend-friendly structure
-                        history_data = {
-                            "events": [],
-                            "total_events": 0,
-                            "last_sale": None,
-                            "last_rental": None,
-                            "last_listing": None,
-                            "events_by_type": {
-                                "sale": [],
-                                "rental": [],
-                                "listing": [],
-                                "other": []
-                            }
-                        }
-                        
-                        # Try to find timeline items using the same selectors as sales_scraping.py
-                        timeline_items = []
-                        timeline_selectors = [
-                            '.property-timeline__timeline--tab-content ul li',
-                            '.property-timeline__timeline--tab-content li',
-                            '.timeline--tab-content ul li',
-                            '.timeline--tab-content li',
-                            '[data-testid="timeline-item"]',
-                            '.timeline-item'
-                        ]
-                        
-                        for selector in timeline_selectors:
+                        previous_items = driver.find_elements(By.CSS_SELECTOR, _TIMELINE_ITEM_SEL)
+                        if activate_tab(driver, tab_element):
+                            # Wait for the new timeline instead of a fixed sleep
                             try:
-                                timeline_items = driver.find_elements(By.CSS_SELECTOR, selector)
-                                if timeline_items:
-                                    break
-                            except:
-                                continue
+                                WebDriverWait(driver, TIMELINE_WAIT_TIMEOUT).until(
+                                    timeline_ready(previous_items[0] if previous_items else None)
+                                )
+                            except TimeoutException:
+                                pass
                         
-                        for item in timeline_items:
+                        # Built lazily from _EMPTY_HISTORY_TEMPLATE on the first timeline row
+                        history_data = None
+                        
+                        # Extract every timeline item in one round-trip, using the same item
+                        # selectors as sales_scraping.py, instead of querying each item from Python
+                        timeline_rows = driver.execute_script(
+                            _TIMELINE_ROWS_JS,
+                            _TIMELINE_ITEM_SELECTORS,
+                            _TIMELINE_DATE_SELECTORS,
+                            _TIMELINE_DESC_SELECTORS,
+                            _TIMELINE_DETAIL_SELECTORS
+                        ) or []
+
+                        for row in timeline_rows:
+                            if history_data is None:
+                                history_data = copy.deepcopy(_EMPTY_HISTORY_TEMPLATE)
                             try:
-                                event = {}
-                                
-                                # Extract date using the same selectors as sales_scraping.py
-                                date_selectors = ['.date-circle .circle', '.date-circle', '.timeline-date', '.date', '[data-testid="timeline-date"]']
-                                for date_selector in date_selectors:
-                                    try:
-                                        date_elem = item.find_element(By.CSS_SELECTOR, date_selector)
-                                        event["date"] = date_elem.text.strip()
-                                        break
-                                    except:
-                                        continue
-                                
-                                # Extract event type/description using the same selectors as sales_scraping.py
-                                desc_selectors = ['.prop-info .heading', '.prop-info .title', '.timeline-title', '.heading', '.title', '[data-testid="timeline-title"]']
-                                for desc_selector in desc_selectors:
-                                    try:
-                                        desc_elem = item.find_element(By.CSS_SELECTOR, desc_selector)
-                                        event["description"] = desc_elem.text.strip()
-                                        break
-                                    except:
-                                        continue
-                                
-                                # Extract details using the same selectors as sales_scraping.py
-                                details = []
-                                detail_selectors = ['.prop-info .details', '.timeline-details', '.details', '.info']
-                                for detail_selector in detail_selectors:
-                                    try:
-                                        detail_elems = item.find_elements(By.CSS_SELECTOR, detail_selector)
-                                        for detail in detail_elems:
-                                            detail_text = detail.text.strip()
-                                            if detail_text:
-                                                details.append(detail_text)
-                                        if details:
-                                            break
-                                    except:
-                                        continue
-                                
-                                if details:
-                                    event["details"] = details
+                                # Only non-empty fields are kept so the JSON shape matches earlier output
+                                event = {field: row[field] for field in _TIMELINE_EVENT_FIELDS if row.get(field)}
                                 
                                 # Determine event type and organize data
-                                if event.get("description", "").lower() in ["sold", "sale"]:
-                                    event["type"] = "sale"
-                                    if not history_data["last_sale"]:
-                                        history_data["last_sale"] = event
-                                    history_data["events_by_type"]["sale"].append(event)
-                                elif event.get("description", "").lower() in ["rented", "rental", "lease"]:
-                                    event["type"] = "rental"
-                                    if not history_data["last_rental"]:
-                                        history_data["last_rental"] = event
-                                    history_data["events_by_type"]["rental"].append(event)
-                                elif event.get("description", "").lower() in ["listed", "listing"]:
-                                    event["type"] = "listing"
-                                    if not history_data["last_listing"]:
-                                        history_data["last_listing"] = event
-                                    history_data["events_by_type"]["listing"].append(event)
-                                else:
-                                    event["type"] = "other"
-                                    history_data["events_by_type"]["other"].append(event)
+                                desc_norm = event.get("description", "").lower()
+                                event_type = _EVENT_TYPE_MAP.get(desc_norm, "other")
+                                event["type"] = event_type
+                                if event_type != "other" and not history_data[f"last_{event_type}"]:
+                                    history_data[f"last_{event_type}"] = event
+                                history_data["events_by_type"][event_type].append(event)
                                 
                                 if event.get("date") or event.get("description"):
                                     history_data["events"].append(event)
                                     
                             except Exception as e:
-                                logger.error(f"⚠️ Error extracting timeline item: {e}")
+                                logger.error("⚠️ Error extracting timeline item: %s", e)
                                 continue
                         
-                        history_data["total_events"] = len(history_data["events"])
+                        event_count = len(history_data["events"]) if history_data else 0
                         
                         # Use both JSON and fallback text extraction like sales_scraping.py
-                        history_json = json.dumps(history_data) if history_data["events"] else "{}"
-                        
-                        # Also extract as simple text items for fallback
-                        history_items = []
-                        for item in timeline_items:
-                            try:
-                                # Extract date
-                                date_text = ""
-                                date_selectors = ['.date-circle .circle', '.date-circle', '.timeline-date', '.date', '[data-testid="timeline-date"]']
-                                for date_selector in date_selectors:
-                                    try:
-                                        date_elem = item.find_element(By.CSS_SELECTOR, date_selector)
-                                        date_text = date_elem.text.strip()
-                                        if date_text:
-                                            break
-                                    except:
-                                        continue
-                                
-                                # Extract description
-                                desc_text = ""
-                                desc_selectors = ['.prop-info .heading', '.prop-info .title', '.timeline-title', '.heading', '.title', '[data-testid="timeline-title"]']
-                                for desc_selector in desc_selectors:
-                                    try:
-                                        desc_elem = item.find_element(By.CSS_SELECTOR, desc_selector)
-                                        desc_text = desc_elem.text.strip()
-                                        if desc_text:
-                                            break
-                                    except:
-                                        continue
-                                
-                                # Extract details
-                                details = []
-                                detail_selectors = ['.prop-info .details', '.timeline-details', '.details', '.info']
-                                for detail_selector in detail_selectors:
-                                    try:
-                                        detail_elems = item.find_elements(By.CSS_SELECTOR, detail_selector)
-                                        for detail in detail_elems:
-                                            detail_text = detail.text.strip()
-                                            if detail_text:
-                                                details.append(detail_text)
-                                        if details:
-                                            break
-                                    except:
-                                        continue
-                                
-                                # Create history item
-                                if date_text or desc_text:
-                                    history_item = f"{date_text}: {desc_text}" if date_text and desc_text else (date_text or desc_text)
-                                    if details:
-                                        history_item += f" ({'; '.join(details)})"
-                                    history_items.append(history_item)
-                                else:
-                                    # Fallback: get all text from the item
-                                    item_text = item.text.strip()
-                                    if item_text:
-                                        history_items.append(item_text)
-                            except Exception as e:
-                                continue
+                        if event_count:
+                            history_data["total_events"] = event_count
+                            history_json = _dumps(history_data)
+                        else:
+                            history_json = None
                         
-                        # Use JSON if available, otherwise use text items
-                        property_data[column_name] = history_json if history_json != "{}" else ' | '.join(history_items)
-                        logger.info(f"✅ {tab_name} history extracted: {len(history_data['events'])} JSON events, {len(history_items)} text items")
+                        # Use JSON if available, otherwise join the text items, built only in that case
+                        property_data[column_name] = history_json if history_json is not None else ' | '.join(history_text_items(timeline_rows))
+                        logger.info("✅ %s history extracted: %d JSON events from %d timeline items", tab_name, event_count, len(timeline_rows))
                     else:
                         property_data[column_name] = 'Tab not available'
                 except Exception as e:
                     property_data[column_name] = 'Not available'
-                    logger.error(f"❌ {tab_name} history extraction failed: {e}")
+                    logger.error("❌ %s history extraction failed: %s", tab_name, e)
         except Exception as e:
-            logger.error(f"  ❌ Property history extraction failed: {e}")
+            logger.error("  ❌ Property history extraction failed: %s", e)
         
-        logger.info(f"✅ Successfully extracted comprehensive property data")
+        logger.info("✅ Successfully extracted comprehensive property data")
         return property_data
         
     except Exception as e:
-        logger.error(f"❌ Error extracting property data: {e}")
+        logger.error("❌ Error extracting property data: %s", e)
         return None
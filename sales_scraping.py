@@ -11,36 +11,716 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, StaleElementReferenceException
 import re
 import os
-import json
+import sys
+import orjson
+import csv
+import logging
+import queue
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+
+logger = logging.getLogger(__name__)
+
+# --- Login credentials (set through the environment; login() stops if either is missing) ---
+CORELOGIC_USERNAME = os.getenv("CORELOGIC_USERNAME")
+CORELOGIC_PASSWORD = os.getenv("CORELOGIC_PASSWORD")
+# Present only once the signed-in CoreLogic app has rendered (its crux components); override if the markup changes
+LOGGED_IN_SELECTOR = os.getenv("CORELOGIC_LOGGED_IN_SELECTOR", '[data-testid^="crux-"]')
+
+
+# --- Explicit wait settings ---
+WAIT_POLL_FREQUENCY = 0.25
+WAIT_IGNORED_EXCEPTIONS = (NoSuchElementException, StaleElementReferenceException)
+# Upper bound on waiting for lazy-loaded content after the scroll; no worse than the old two 2s sleeps
+LAZY_CONTENT_TIMEOUT = 4
+# Upper bound on waiting for a clicked tab's content to render
+TAB_CONTENT_TIMEOUT = 5
+# Upper bound on waiting for a valuation or schools panel to show its figures, list or error message
+TAB_PANEL_TIMEOUT = 8
+
+
+# --- Output settings ---
+ROWS_CSV_PATH = os.getenv("SCRAPER_ROWS_CSV", "vic_property_rows.csv")
+# Opt-in (SCRAPER_RESUME=1): skip URLs already in ROWS_CSV_PATH and append to it, so an interrupted run picks up
+# where it stopped; by default every run rewrites the file from scratch
+RESUME_SCRAPE = os.getenv("SCRAPER_RESUME", "0") == "1"
+# Browser sessions scraping in parallel, each logged in separately on the same account; kept small by default
+# so the account is not throttled or locked out, raise it explicitly with SCRAPER_WORKERS
+SCRAPER_WORKERS = int(os.getenv("SCRAPER_WORKERS", "2"))
+# Card output: "parquet" (snappy) or "feather" files for downstream code, or "excel" for one workbook to open by hand
+SAVE_FORMAT = os.getenv("SCRAPER_SAVE_FORMAT", "parquet").lower()
+# Excel output goes through xlsxwriter; URLs stay plain strings (Excel caps a sheet at 65,530 hyperlinks)
+EXCEL_ENGINE_KWARGS = {'options': {'strings_to_urls': False}}
+# Distinct listing descriptions whose parsed agent info is kept in memory
+AGENT_TEXT_CACHE_SIZE = 4096
+
+
+# --- Browser settings ---
+HEADLESS = os.getenv("SCRAPER_HEADLESS", "1") != "0"
+BLOCKED_URL_PATTERNS = [
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg",
+    "*.woff", "*.woff2", "*.ttf", "*.mp4",
+    "*googletagmanager*", "*doubleclick*", "*google-analytics*"
+]
+# Chrome content settings: 2 = block; images are never read and notification prompts can cover the page
+CHROME_PREFS = {
+    "profile.managed_default_content_settings.images": 2,
+    "profile.default_content_setting_values.notifications": 2,
+}
+
+
+# --- Sale text patterns, e.g. "Last Sold on 01 May 2025 for $227,000,000" ---
+_PRICE_RE = re.compile(r'\$([0-9,]+)')
+_DATE_RE = re.compile(r'(\d{1,2} \w+ \d{4})')
+
+# Percentage in the rental yield text, e.g. "Estimated Rental Yield 1.8%"
+_YIELD_RE = re.compile(r'\d+\.?\d*%')
+
+
+# --- Address slug in property URLs, e.g. /property/440-323-greens-road-mambourin-vic-3024/57145835 ---
+_ADDRESS_SLUG_RE = re.compile(r'/property/([^/]+)')
+_STATE_CODES = frozenset({'vic', 'nsw', 'qld', 'sa', 'wa', 'tas', 'nt', 'act'})
+
+
+# --- Agent info patterns, used when the listing description has no agent elements ---
+# All three labels in one pass; the named group says which label matched
+_RE_AGENT_LABELS = re.compile(
+    r'Advertising Agency[:\s]*(?P<advertising_agency>[^\n\r]+)'
+    r'|Advertising Agent[:\s]*(?P<advertising_agent>[^\n\r]+)'
+    r'|Agent Phone Number[:\s]*(?P<agent_phone>[^\n\r]+)',
+    re.IGNORECASE
+)
+# 0439 431 020, 0439.431.020 or 0439431020
+_PHONE_RE = re.compile(r'\b(\d{4}\s\d{3}\s\d{3}|\d{4}\.\d{3}\.\d{3}|\d{10})\b')
+_PHONE_DIGITS = 10
+_AGENCY_PATTERNS = tuple(re.compile(pattern) for pattern in [
+    r'(RT Edgar \w+)',
+    r'\b([A-Z][a-z]+\s+[A-Z][a-z]+\s+(?:Realty|Property|Estate|Group|Agency))\b',
+    r'\b([A-Z][a-z]+\s+[A-Z][a-z]+\s+[A-Z][a-z]+)\b'  # Three word agency names
+])
+# Shortest text any agency pattern can match, e.g. "Ab Cd Ef"
+_MIN_AGENCY_LEN = 8
+_AGENT_PATTERNS = tuple(re.compile(pattern) for pattern in [
+    r'(Sarah Case|Will Hocking)',  # Specific known agents
+    r'\b([A-Z][a-z]+\s+[A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)\b'  # General name pattern
+])
+# Words that mark a pattern match as listing copy rather than an agency or agent name
+_AGENCY_BLOCKLIST = frozenset({
+    'expressions', 'interest', 'closing', 'monday', 'september', 'melbourne', 'location', 'access', 'public', 'transport'
+})
+_AGENT_BLOCKLIST = _AGENCY_BLOCKLIST | frozenset({
+    'victorian', 'terrace', 'soaring', 'ceilings', 'retaining', 'original', 'features', 'pressed', 'metal', 'ornate',
+    'cornice', 'stain', 'glass', 'windows', 'tessellated', 'tiles', 'arched', 'entry', 'hall'
+})
+_WORD_RE = re.compile(r'[a-z]+')
+
+
+# --- Natural risk lines in the panel text, e.g. "Flood Zone: Not detected" ---
+_RISK_RE = re.compile(r'(Flood Zone|Bushfire Zone|Fire Zone|Storm Zone)[:\s]*([^,\n]+)', re.IGNORECASE)
+
+
+# --- "Key: value" lines in a tab's text, used when a tab has no recognised rows ---
+_RE_KV_LINE = re.compile(r'^\s*([^:\n]{1,80}?)\s*:\s*([^\n]+?)\s*$', re.MULTILINE)
+
+
+# --- Property timeline selectors, tried in priority order by TIMELINE_ROWS_JS ---
+TIMELINE_ITEM_SELECTORS = (
+    '.property-timeline__timeline--tab-content ul li',
+    '.property-timeline__timeline--tab-content li',
+    '.timeline--tab-content ul li',
+    '.timeline--tab-content li',
+    '[data-testid="timeline-item"]',
+    '.timeline-item'
+)
+# Any timeline item, for waits that only check whether the timeline has rendered
+TIMELINE_ITEM_SEL = ", ".join(TIMELINE_ITEM_SELECTORS)
+# Property history tab markup variants, joined into one XPath union per tab name
+HISTORY_TAB_XPATHS = (
+    "//div[@role='presentation' and contains(@class, 'property-timeline__timeline--tab') and contains(text(), '{0}')]",
+    "//div[contains(@class, 'property-timeline__timeline--tab') and contains(text(), '{0}')]",
+    "//div[@role='presentation' and text()='{0}']",
+    "//div[contains(@class, 'timeline--tab') and contains(text(), '{0}')]",
+)
+TIMELINE_EMPTY_SEL = '.no-history'
+# A rendered timeline: its items, or the message shown when the tab has none
+TIMELINE_CONTENT_SEL = f'{TIMELINE_ITEM_SEL}, {TIMELINE_EMPTY_SEL}'
+TIMELINE_DATE_SELECTORS = ('.date-circle .circle', '.date-circle', '.timeline-date', '.date', '[data-testid="timeline-date"]')
+TIMELINE_DESC_SELECTORS = ('.prop-info .heading', '.prop-info .title', '.timeline-title', '.heading', '.title', '[data-testid="timeline-title"]')
+TIMELINE_DETAIL_SELECTORS = ('.prop-info .details', '.timeline-details', '.details', '.info')
+
+# --- Label/content cells inside Property Features and Land Values rows, tried in order until one has text ---
+ROW_LABEL_SELECTORS = ['.flex-label p', '.flex-label', 'p:first-child', '.label']
+ROW_CONTENT_SELECTORS = ['.flex-content p', '.flex-content', 'p:last-child', '.value', '.content']
+
+# --- Row selectors per Additional Information tab, tried in order until one matches ---
+# Container that holds each Additional Information tab's content once it has rendered
+ADDITIONAL_TAB_CONTAINERS = {
+    'Legal Description': '#legal-description',
+    'Property Features': '#property-features',
+    'Land Values': '#land-values'
+}
+LEGAL_ROW_SELECTORS = ['#legal-description .legal-desc-row']
+FEATURE_ROW_SELECTORS = [
+    '#property-features .flex-container',
+    '#property-features .legal-desc-row',
+    '#property-features .flex-label',
+    '.tab-content .flex-container',
+    '.tab-content .legal-desc-row'
+]
+LAND_VALUE_ROW_SELECTORS = [
+    '#land-values .flex-container',
+    '#land-values .legal-desc-row',
+    '#land-values .flex-label',
+    '.tab-content .flex-container',
+    '.tab-content .legal-desc-row'
+]
+
+# Lowercase timeline description -> event type; anything else is "other"
+EVENT_TYPE_MAP = {
+    "sold": "sale", "sale": "sale",
+    "rented": "rental", "rental": "rental", "lease": "rental",
+    "listed": "listing", "listing": "listing"
+}
+
+# Returns {date, description, details, text} per timeline item; arguments are the item, date, description and detail
+# selector lists, each tried in order: items and date/description come from the first selector that matches, details
+# from the first selector with any non-empty text
+TIMELINE_ROWS_JS = """
+    const [itemSels, dateSels, descSels, detailSels] = arguments;
+    const pick = (node, sels) => {
+        for (const sel of sels) {
+            const elem = node.querySelector(sel);
+            if (elem) return elem.innerText.trim();
+        }
+        return null;
+    };
+    const pickAll = (node, sels) => {
+        for (const sel of sels) {
+            const texts = Array.from(node.querySelectorAll(sel), d => d.innerText.trim()).filter(Boolean);
+            if (texts.length) return texts;
+        }
+        return [];
+    };
+    let items = [];
+    for (const sel of itemSels) {
+        items = document.querySelectorAll(sel);
+        if (items.length) break;
+    }
+    return Array.from(items, item => ({
+        date: pick(item, dateSels),
+        description: pick(item, descSels),
+        details: pickAll(item, detailSels),
+        text: item.innerText.trim()
+    }));
+"""
+
+# Returns [risk type, status] for each natural-risk container that has both texts, searching only inside the panel
+NATURAL_RISK_ROWS_JS = """
+    const panel = document.querySelector('[data-testid="natural-risks-panel"]');
+    const containers = panel ? panel.querySelectorAll('.MuiGrid-container .MuiGrid-direction-xs-column') : [];
+    return Array.from(containers, container => {
+        const typeElem = container.querySelector('.MuiTypography-body1');
+        const statusElem = container.querySelector('.MuiTypography-body2');
+        return typeElem && statusElem ? [typeElem.innerText.trim(), statusElem.innerText.trim()] : null;
+    }).filter(Boolean);
+"""
+
+# (key, selector) pairs read from each nearby-school list item; a school missing any _SCHOOL_FIELDS entry is
+# skipped, while a missing _SCHOOL_ATTRIBUTE_FIELDS chip is stored as ''
+_SCHOOL_FIELDS = (
+    ('name', '.school-name'),
+    ('address', '.place-address'),
+    ('distance', '.school-distance'),
+)
+_SCHOOL_ATTRIBUTE_FIELDS = (
+    ('type', '[data-testid="schoolType"] .MuiChip-label'),
+    ('sector', '[data-testid="schoolSector"] .MuiChip-label'),
+    ('gender', '[data-testid="schoolGender"] .MuiChip-label'),
+    ('year_levels', '[data-testid="schoolYear"] .MuiChip-label'),
+    ('enrollments', '[data-testid="schoolEnrolments"] .MuiChip-label'),
+)
+
+# Body of a function returning every school in the list as {<_SCHOOL_FIELDS keys>, attributes}; expects the
+# school panel element (or null) and the schoolFields and attributeFields pair lists in scope
+SCHOOL_ITEMS_JS = """
+    const items = panel ? panel.querySelectorAll('ul.nearby-school-list-container li[data-testid="list-template"]') : [];
+    const textOf = (item, sel) => {
+        const elem = item.querySelector(sel);
+        return elem ? elem.innerText.trim() : null;
+    };
+    return Array.from(items, item => {
+        const school = {};
+        for (const [key, sel] of schoolFields) {
+            school[key] = textOf(item, sel);
+            if (school[key] === null) return null;
+        }
+        school.attributes = {};
+        for (const [key, sel] of attributeFields) {
+            school.attributes[key] = textOf(item, sel) || '';
+        }
+        return school;
+    }).filter(Boolean);
+"""
+
+# Scrolls the nearby-school list until its height holds for two checks (or maxChecks runs out), then calls back
+# with {scrolled, checks, schools}; run with execute_async_script, arguments are the check interval (ms), maxChecks,
+# _SCHOOL_FIELDS and _SCHOOL_ATTRIBUTE_FIELDS
+SCHOOLS_SCROLL_AND_COLLECT_JS = """
+    const [intervalMs, maxChecks, schoolFields, attributeFields, done] = arguments;
+    const panel = document.querySelector('[data-testid="nearby-school-panel"]');
+    const collect = () => {""" + SCHOOL_ITEMS_JS + """};
+    const container = panel && panel.querySelector('.simplebar-content');
+    if (!container) { return done({scrolled: false, checks: 0, schools: collect()}); }
+    let lastHeight = -1, stableChecks = 0, checks = 0;
+    const step = () => {
+        container.scrollTop = container.scrollHeight;
+        const height = container.scrollHeight;
+        stableChecks = height === lastHeight ? stableChecks + 1 : 0;
+        lastHeight = height;
+        checks += 1;
+        if (stableChecks >= 2 || checks >= maxChecks) {
+            return done({scrolled: true, checks: checks, schools: collect()});
+        }
+        setTimeout(step, intervalMs);
+    };
+    step();
+"""
+SCHOOL_SCROLL_INTERVAL_MS = 250
+SCHOOL_SCROLL_MAX_CHECKS = 20
+
+# Clicks a tab unless it is already the selected one; returns whether it clicked
+_CLICK_UNLESS_ACTIVE_JS = """
+    const tab = arguments[0];
+    if (tab.getAttribute('aria-selected') === 'true' || tab.classList.contains('active') || tab.classList.contains('selected')) {
+        return false;
+    }
+    tab.click();
+    return true;
+"""
+
+# Trimmed innerText of the first match for a selector, or '' when nothing matches
+_ELEMENT_TEXT_JS = "const elem = document.querySelector(arguments[0]); return elem ? elem.innerText.trim() : '';"
+
+# Returns {text, active} once any element matching the ready selector is visible (null before that): the panel's
+# text and whether the clicked tab is marked as the selected one
+_PANEL_READY_JS = """
+    const [panelSelector, readySelector, tab] = arguments;
+    const ready = Array.from(document.querySelectorAll(readySelector)).some(elem => elem.getClientRects().length > 0);
+    const panel = ready && document.querySelector(panelSelector);
+    if (!panel) return null;
+    const active = tab.getAttribute('aria-selected') === 'true' || tab.classList.contains('active') || tab.classList.contains('selected');
+    return {text: panel.innerText.trim(), active: active};
+"""
+
+# What a loaded valuation / schools tab panel shows: its figures or list, or the site's error message
+AVM_PANEL_SEL = '[data-testid="avm-detail"]'
+AVM_READY_SEL = '[data-testid="avm-range"] .valuation-range-footer, [data-testid="avm-detail"] .error-fetching span'
+# Low / estimate / high figures, relative to the range chart footer
+AVM_RANGE_SELECTORS = {
+    'low_value': '.flex-grow:first-child .author',
+    'estimate_value': '.flex-grow:nth-child(2) .legend .author',
+    'high_value': '.flex-grow:last-child .author',
+}
+# Finds the avm-detail panel and range footer once and reads everything the valuation / rental tabs use from
+# inside them: {error, confidence, yield_text, <AVM_RANGE_SELECTORS keys>}, '' for anything missing
+AVM_PANEL_JS = """
+    const rangeSelectors = arguments[0];
+    const detail = document.querySelector('[data-testid="avm-detail"]');
+    const footer = document.querySelector('[data-testid="avm-range"] .valuation-range-footer');
+    const textIn = (root, sel) => {
+        const elem = root && root.querySelector(sel);
+        return elem ? elem.innerText.trim() : '';
+    };
+    const found = {
+        error: textIn(detail, '.error-fetching span'),
+        confidence: textIn(detail, '.confidence'),
+        yield_text: textIn(document, '#rental-avm-details')
+    };
+    for (const [key, sel] of Object.entries(rangeSelectors)) found[key] = textIn(footer, sel);
+    return found;
+"""
+# (summary label, JSON key) for the valuation / rental summary line, in display order
+AVM_SUMMARY_FIELDS = (
+    ('Low', 'low_value'),
+    ('Estimate', 'estimate_value'),
+    ('High', 'high_value'),
+    ('Yield', 'rental_yield'),
+    ('Confidence', 'confidence'),
+)
+SCHOOL_PANEL_SEL = '[data-testid="nearby-school-panel"]'
+SCHOOL_READY_SEL = ('[data-testid="nearby-school-panel"] ul.nearby-school-list-container li, '
+                    '[data-testid="nearby-school-panel"] .error-fetching span')
+
+# Clicks a visible "Show More" link inside the listing description, waits for the DOM to settle and
+# calls back with {found, expanded, text}; run with execute_async_script
+LISTING_DESCRIPTION_JS = """
+    const done = arguments[arguments.length - 1];
+    const desc = document.querySelector('[data-testid="listing-desc"]');
+    if (!desc) { return done({found: false, expanded: false, text: ''}); }
+    const finish = (expanded) => requestAnimationFrame(() => requestAnimationFrame(
+        () => done({found: true, expanded: expanded, text: desc.innerText.trim()})));
+    const more = desc.querySelector('a[href="#"], .show-more, [data-testid="show-more"]');
+    if (!more || !more.offsetParent) { return finish(false); }
+    // The settle timer restarts on every mutation; the cap timer is never cleared by them, so a description
+    // that keeps changing still finishes after 1500 ms
+    let settleTimer = null, finished = false;
+    const settle = () => {
+        if (finished) return;
+        finished = true;
+        clearTimeout(settleTimer);
+        clearTimeout(capTimer);
+        observer.disconnect();
+        finish(true);
+    };
+    const observer = new MutationObserver(() => {
+        clearTimeout(settleTimer);
+        settleTimer = setTimeout(settle, 100);
+    });
+    observer.observe(desc, {childList: true, subtree: true, characterData: true});
+    const capTimer = setTimeout(settle, 1500);
+    more.click();
+"""
+
+
+# --- Static page fields, read together in one round-trip by read_texts ---
+STATIC_FIELD_SELECTORS = {
+    'Property_Type': '#attr-property-type',
+    'Sale_Text': '.sale-price',
+    'Sold_By': '[data-testid="sale-detail-sold-by"] .property-attribute-val',
+    'Land_Use': '[data-testid="sale-detail-land-use"] .property-attribute-val',
+    'Issue_Date': '[data-testid="sale-detail-issue-date"] .property-attribute-val',
+    'Advertisement_Date': '[data-testid="advertisement-date"] .attr-value',
+    'Owner_Type': '.owner-type',
+    'Current_Tenure': '.tenure',
+    'Properties_Sold_12_Months': '[data-testid="metric-id-37"] .value'
+}
+
+# --- Property attribute containers; the value is the second span inside each ---
+PROPERTY_ATTRIBUTE_SELECTORS = {
+    'bedrooms': '[data-testid="property-attr-bed"] .property-attribute-val',
+    'bathrooms': '[data-testid="property-attr-bath"] .property-attribute-val',
+    'car_spaces': '[data-testid="property-attr-car"] .property-attribute-val',
+    'land_size': '[data-testid="val-land-area"]',
+    'floor_area': '[data-testid="val-floor-area"]'
+}
+PROPERTY_ATTRIBUTE_COLUMNS = {
+    'bedrooms': 'Bedrooms',
+    'bathrooms': 'Bathrooms',
+    'car_spaces': 'Car_Spaces',
+    'land_size': 'Land_Size',
+    'floor_area': 'Floor_Area'
+}
+
+
+# --- Advertising agent fields, searched inside the listing description element with one union each ---
+AGENT_FIELD_SELECTORS = {
+    'advertising_agency': '.advertising-agency, .agency, .advertising-agency-name',
+    'advertising_agent': '.advertising-agent, .agent-name, .advertising-agent-name',
+    'agent_phone': '.agent-phone, .phone, .agent-phone-number'
+}
+
+
+# --- Structured legal description fields ---
+LEGAL_FIELD_SELECTORS = {
+    'RPD': '[data-testid="legal-rpd"] .attr-value',
+    'Zoning': '[data-testid="legal-zoning"] .attr-value',
+    'Title Ref': '[data-testid="legal-title-ref"] .attr-value',
+    'Title Indicator': '[data-testid="legal-title-indicator"] .attr-value',
+    'LA': '[data-testid="legal-la"] .attr-value',
+    'Issue Date': '[data-testid="legal-issue-date"] .attr-value',
+    'Fee Code': '[data-testid="legal-fee-code"] .attr-value'
+}
+
+# --- Key/value row extractors: (container, row, key, value) selectors for _extract_kv ---
+_EXTRACTORS = {
+    'legal': (
+        '#legal-description, .legal-description, [data-testid="legal-description"]',
+        'tr, .row, .field',
+        'td:first-child, .key, .label, strong',
+        'td:last-child, .value, .data'
+    ),
+    'features': (
+        None,
+        '[data-testid="property-feature"], .property-feature, .feature-item',
+        '.feature-name, .feature-key, strong, .label',
+        '.feature-value, .feature-data, .value'
+    ),
+    'land_values': (
+        None,
+        '[data-testid="land-value"], .land-value, .value-item',
+        '.value-name, .value-key, strong, .label',
+        '.value-amount, .value-data, .value'
+    )
+}
+
+
+# --- Per-property debug dump ---
+# (label, column, truncate) for the per-property debug dump; truncated values are cut to 100 characters
+_DEBUG_SUMMARY_FIELDS = (
+    ('Address', 'Address', False),
+    ('Property Type', 'Property_Type', False),
+    ('Land Size', 'Land_Size', False),
+    ('Last Sold Price', 'Last_Sold_Price', False),
+    ('Last Sold Date', 'Last_Sold_Date', False),
+    ('Sold By', 'Sold_By', False),
+    ('Advertisement Date', 'Advertisement_Date', False),
+    ('Listing Description', 'Listing_Description', True),
+    ('Advertising Agent Info', 'Advertising_Agent_Info_JSON', True),
+    ('Property History All', 'Property_History_All', True),
+    ('Property History Sale', 'Property_History_Sale', True),
+    ('Natural Risks', 'Natural_Risks', False),
+    ('Valuation Estimate', 'Valuation_Estimate_Estimate', True),
+    ('Valuation Estimate JSON', 'Valuation_Estimate_Estimate_JSON', True),
+    ('Rental Estimate', 'Valuation_Estimate_Rental', True),
+    ('Rental Estimate JSON', 'Valuation_Estimate_Rental_JSON', True),
+    ('Schools In Catchment', 'Nearby_Schools_In_Catchment', True),
+    ('Schools All Nearby', 'Nearby_Schools_All_Nearby', True),
+    ('Legal Description', 'Additional_Information_Legal_Description', True),
+    ('Property Features', 'Additional_Information_Property_Features', True),
+    ('Land Values', 'Additional_Information_Land_Values', True),
+    ('Owner Information', 'Household_Information_Owner_Information', True),
+    ('Marketing Contacts', 'Household_Information_Marketing_Contacts', True),
+)
+# (label, column) for the JSON columns in the debug dump, logged in full
+_DEBUG_JSON_FIELDS = (
+    ('Property Attributes JSON', 'Property_Attributes_JSON'),
+    ('Sale Information JSON', 'Sale_Information_JSON'),
+    ('Advertising Agent Info JSON', 'Advertising_Agent_Info_JSON'),
+    ('Natural Risks JSON', 'Natural_Risks_JSON'),
+    ('Valuation Estimate JSON', 'Valuation_Estimate_Estimate_JSON'),
+    ('Rental Estimate JSON', 'Valuation_Estimate_Rental_JSON'),
+)
+
+
+# --- Output row with every column in file order; copied for each property ---
+_ROW_TEMPLATE = {
+    'Property_URL': '',
+    'Address': '',
+    'Bedrooms': '',
+    'Bathrooms': '',
+    'Car_Spaces': '',
+    'Land_Size': '',
+    'Floor_Area': '',
+    'Property_Type': '',
+    'Last_Sold_Price': '',
+    'Last_Sold_Date': '',
+    'Sold_By': '',
+    'Land_Use': '',
+    'Issue_Date': '',
+    'Advertisement_Date': '',
+    'Listing_Description': '',
+    'Advertising_Agent_Info_JSON': '',
+    'Owner_Type': '',
+    'Current_Tenure': '',
+    'Title_Indicator': '',
+    'LA': '',
+    'Properties_Sold_12_Months': '',
+    'Property_History_All': '',
+    'Property_History_Sale': '',
+    'Property_History_Listing': '',
+    'Property_History_Rental': '',
+    'Property_History_DA': '',
+    'Natural_Risks': '',
+    'Valuation_Estimate_Estimate': '',
+    'Valuation_Estimate_Estimate_JSON': '',
+    'Valuation_Estimate_Rental': '',
+    'Valuation_Estimate_Rental_JSON': '',
+    'Nearby_Schools_In_Catchment': '',
+    'Nearby_Schools_All_Nearby': '',
+    'Additional_Information_Legal_Description': '',
+    'Additional_Information_Property_Features': '',
+    'Additional_Information_Land_Values': '',
+    'Household_Information_Owner_Information': '',
+    'Household_Information_Marketing_Contacts': '',
+    # JSON structured data columns
+    'Property_Attributes_JSON': '',
+    'Sale_Information_JSON': '',
+    'Natural_Risks_JSON': '',
+    'Scraping_Date': ''
+}
+
+
+# --- Card tables: the columns of each card (a sheet in the workbook or its own Parquet/Feather file), projected from the full rows ---
+CARD_COLUMNS = {
+    'Property_Overview': [
+        'Property_URL',
+        'Address',
+        'Property_Type',
+        'Land_Size',
+        'Floor_Area',
+        'Bedrooms',
+        'Bathrooms',
+        'Car_Spaces',
+        'Scraping_Date',
+    ],
+    'Sale_Rental_Info': [
+        'Property_URL',
+        'Address',
+        'Last_Sold_Price',
+        'Last_Sold_Date',
+        'Sold_By',
+        'Land_Use',
+        'Issue_Date',
+        'Advertisement_Date',
+        'Listing_Description',
+        'Advertising_Agent_Info_JSON',
+        'Sale_Information_JSON',
+        'Scraping_Date',
+    ],
+    'Household_Info': [
+        'Property_URL',
+        'Address',
+        'Owner_Type',
+        'Current_Tenure',
+        'Household_Information_Owner_Information',
+        'Household_Information_Marketing_Contacts',
+        'Scraping_Date',
+    ],
+    'Additional_Info': [
+        'Property_URL',
+        'Address',
+        'Additional_Information_Legal_Description',
+        'Additional_Information_Property_Features',
+        'Additional_Information_Land_Values',
+        'Scraping_Date',
+    ],
+    'Natural_Risks': [
+        'Property_URL',
+        'Address',
+        'Natural_Risks',
+        'Natural_Risks_JSON',
+        'Scraping_Date',
+    ],
+    'Schools': [
+        'Property_URL',
+        'Address',
+        'Nearby_Schools_In_Catchment',
+        'Nearby_Schools_All_Nearby',
+        'Scraping_Date',
+    ],
+    'Valuation_Estimates': [
+        'Property_URL',
+        'Address',
+        'Valuation_Estimate_Estimate',
+        'Valuation_Estimate_Estimate_JSON',
+        'Valuation_Estimate_Rental',
+        'Valuation_Estimate_Rental_JSON',
+        'Scraping_Date',
+    ],
+    'Property_History': [
+        'Property_URL',
+        'Address',
+        'Property_History_All',
+        'Property_History_Sale',
+        'Property_History_Listing',
+        'Property_History_Rental',
+        'Property_History_DA',
+        'Properties_Sold_12_Months',
+        'Scraping_Date',
+    ],
+}
 
 
 # --- Helper functions ---
-def wait_until_clickable(driver, by, value, check_interval=0.5, timeout=None):
-    """Wait until an element is displayed and enabled (clickable)."""
-    start = time.time()
-    while True:
-        try:
-            elem = driver.find_element(by, value)
-            if elem.is_displayed() and elem.is_enabled():
-                return elem
-        except (NoSuchElementException, StaleElementReferenceException):
-            pass
-        time.sleep(check_interval)
-        if timeout and (time.time() - start) > timeout:
-            raise TimeoutError(f"Element {value} not clickable after {timeout} seconds")
-
-def wait_until_present(driver, by, value, check_interval=0.5, timeout=None):
-    """Wait until an element exists in DOM."""
-    start = time.time()
-    while True:
-        try:
-            elem = driver.find_element(by, value)
-            return elem
-        except (NoSuchElementException, StaleElementReferenceException):
-            pass
-        time.sleep(check_interval)
-        if timeout and (time.time() - start) > timeout:
-            raise TimeoutError(f"Element {value} not found after {timeout} seconds")
+def build_chrome_options(headless=HEADLESS):
+    """Chrome options for scraping: optionally headless, with images, notifications and extensions disabled."""
+    options = Options()
+    # Return from driver.get at DOMContentLoaded; explicit waits cover the elements we read
+    options.page_load_strategy = "eager"
+    if headless:
+        options.add_argument("--headless=new")
+        options.add_argument("--disable-gpu")
+    else:
+        options.add_experimental_option("detach", True)
+    options.add_experimental_option("prefs", CHROME_PREFS)
+    options.add_argument("--blink-settings=imagesEnabled=false")
+    options.add_argument("--disable-extensions")
+    options.add_argument("--disable-dev-shm-usage")
+    options.add_argument("--no-sandbox")
+    return options
+
+def block_heavy_resources(driver):
+    """Stop the browser from downloading images, fonts, video and trackers the scraper never reads."""
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
+    except Exception as e:
+        logger.warning("⚠️ Could not enable resource blocking: %s", e)
+
+def _dumps(obj):
+    """Serialize obj to a JSON string with orjson (C implementation, compact output)."""
+    return orjson.dumps(obj).decode()
+
+def read_texts(driver, selectors):
+    """Return the trimmed text of the first match for each selector, keyed like selectors, in one call."""
+    try:
+        return driver.execute_script("""
+            const texts = {};
+            for (const [key, selector] of Object.entries(arguments[0])) {
+                const elem = document.querySelector(selector);
+                texts[key] = elem ? elem.innerText.trim() : '';
+            }
+            return texts;
+        """, selectors) or {}
+    except Exception as e:
+        logger.warning("  ⚠️ Batched text read failed: %s", e)
+        return {}
+
+def read_attribute_values(driver, selectors):
+    """Return the second span's text inside each attribute container, or '-' when missing, in one call."""
+    try:
+        values = driver.execute_script("""
+            const values = {};
+            for (const [key, selector] of Object.entries(arguments[0])) {
+                const container = document.querySelector(selector);
+                const spans = container ? container.querySelectorAll('span') : [];
+                values[key] = spans.length > 1 ? spans[1].innerText.trim() : '-';
+            }
+            return values;
+        """, selectors) or {}
+    except Exception as e:
+        logger.error("  ❌ Property attributes extraction failed: %s", e)
+        values = {}
+    return {key: values.get(key, '-') for key in selectors}
+
+def read_tab_content_pairs(driver):
+    """Return (key, value) pairs from the "key: value" lines of .tab-content's text, read in one call."""
+    text = driver.execute_script(_ELEMENT_TEXT_JS, '.tab-content') or ''
+    return _RE_KV_LINE.findall(text)
+
+def find_tab_menus(driver):
+    """Map each crux tab menu's name (its data-testid after "crux-tab-menu-") to the first such element, in one call."""
+    return driver.execute_script("""
+        const tabs = {};
+        for (const elem of document.querySelectorAll('[data-testid^="crux-tab-menu-"]')) {
+            const name = elem.getAttribute('data-testid').slice('crux-tab-menu-'.length);
+            if (!(name in tabs)) tabs[name] = elem;
+        }
+        return tabs;
+    """) or {}
+
+def read_row_pairs(driver, row_selectors, label_selectors=ROW_LABEL_SELECTORS, content_selectors=ROW_CONTENT_SELECTORS):
+    """Return {selector, pairs} for the first row selector with matches, reading each row's label and content in the browser.
+    
+    Label and content each come from the first of their selectors, in priority order, whose match has text.
+    """
+    return driver.execute_script("""
+        const [rowSelectors, labelSelectors, contentSelectors] = arguments;
+        const firstText = (row, sels) => {
+            for (const sel of sels) {
+                const elem = row.querySelector(sel);
+                const text = elem ? elem.innerText.trim() : '';
+                if (text) return text;
+            }
+            return '';
+        };
+        for (const selector of rowSelectors) {
+            const rows = document.querySelectorAll(selector);
+            if (!rows.length) continue;
+            return {selector: selector, pairs: Array.from(rows, row => [firstText(row, labelSelectors), firstText(row, contentSelectors)])};
+        }
+        return {selector: null, pairs: []};
+    """, row_selectors, label_selectors, content_selectors) or {'selector': None, 'pairs': []}
 
 def safe_get_text(driver, by, value, default=""):
     """Safely get text from an element, return default if not found."""
@@ -50,6 +730,12 @@ def safe_get_text(driver, by, value, default=""):
     except (NoSuchElementException, StaleElementReferenceException):
         return default
 
+def _text_if_present(driver, selector):
+    """Return the trimmed text of the first selector match, or None when nothing matches, without an error round-trip."""
+    return driver.execute_script(
+        "const elem = document.querySelector(arguments[0]); return elem ? elem.innerText.trim() : null;", selector
+    )
+
 def safe_get_attribute(driver, by, value, attribute, default=""):
     """Safely get attribute from an element, return default if not found."""
     try:
@@ -58,134 +744,163 @@ def safe_get_attribute(driver, by, value, attribute, default=""):
     except (NoSuchElementException, StaleElementReferenceException):
         return default
 
+def wait_and_get_text_js(driver, selector, timeout=TAB_CONTENT_TIMEOUT, previous=None):
+    """Poll in the browser until selector has non-empty text (different from previous, if given) and return it.
+    
+    On timeout, return whatever text is there now, or '' when the element is missing.
+    """
+    def ready_text(d):
+        text = d.execute_script(_ELEMENT_TEXT_JS, selector)
+        return text if text and text != previous else False
+    
+    try:
+        return WebDriverWait(driver, timeout, poll_frequency=WAIT_POLL_FREQUENCY).until(ready_text)
+    except TimeoutException:
+        return driver.execute_script(_ELEMENT_TEXT_JS, selector) or ''
+
+def find_history_tab(driver, tab_name):
+    """Return the first displayed property history tab named tab_name (or the first match), or None."""
+    candidates = driver.find_elements(By.XPATH, " | ".join(xpath.format(tab_name) for xpath in HISTORY_TAB_XPATHS))
+    return next((candidate for candidate in candidates if candidate.is_displayed()), candidates[0] if candidates else None)
+
+def timeline_ready(previous_item):
+    """Expected condition: the previous tab's timeline has been replaced and new items (or the empty message) are present."""
+    def condition(driver):
+        if previous_item is not None and not EC.staleness_of(previous_item)(driver):
+            return False
+        return bool(driver.find_elements(By.CSS_SELECTOR, TIMELINE_CONTENT_SEL))
+    return condition
+
+def switch_tab_panel(driver, tab_element, panel_selector, ready_selector, previous=None, timeout=TAB_PANEL_TIMEOUT):
+    """Click tab_element, wait until its panel content is shown and return the panel_selector text.
+    
+    previous is the panel text from the tab shown before the click (None for the first tab). The new content is
+    accepted once ready_selector is visible and either the old panel node has been replaced, the clicked tab is
+    marked selected, or the text differs from previous, so tabs with identical content do not wait out the timeout.
+    On timeout, log it and return the current text so extraction can still try.
+    """
+    old_panels = driver.find_elements(By.CSS_SELECTOR, panel_selector) if previous is not None else []
+    driver.execute_script("arguments[0].click();", tab_element)
+    
+    def ready_text(d):
+        shown = d.execute_script(_PANEL_READY_JS, panel_selector, ready_selector, tab_element)
+        if not shown:
+            return False
+        if (previous is None or shown['active'] or shown['text'] != previous
+                or (old_panels and EC.staleness_of(old_panels[0])(d))):
+            return shown['text'] or True
+        return False
+    
+    try:
+        text = WebDriverWait(driver, timeout, poll_frequency=WAIT_POLL_FREQUENCY,
+                             ignored_exceptions=WAIT_IGNORED_EXCEPTIONS).until(ready_text)
+        return text if isinstance(text, str) else ''
+    except TimeoutException:
+        logger.warning("  ⚠️ %s not ready after %s seconds, continuing anyway...", panel_selector, timeout)
+        return driver.execute_script(_ELEMENT_TEXT_JS, panel_selector) or ''
+
+def read_avm_panel(driver):
+    """Return the shown valuation or rental tab's error, confidence, yield text and range figures, in one call."""
+    return driver.execute_script(AVM_PANEL_JS, AVM_RANGE_SELECTORS) or {}
+
+def read_agent_fields(driver):
+    """Return the first non-empty text for each AGENT_FIELD_SELECTORS field inside the listing description, in one call."""
+    return driver.execute_script("""
+        const fields = arguments[0];
+        const roots = document.querySelectorAll('[data-testid="listing-desc"], .listing-desc');
+        const found = {};
+        for (const [field, selector] of Object.entries(fields)) {
+            found[field] = '';
+            for (const root of roots) {
+                const text = Array.from(root.querySelectorAll(selector), elem => elem.innerText.trim()).find(Boolean);
+                if (text) { found[field] = text; break; }
+            }
+        }
+        return found;
+    """, AGENT_FIELD_SELECTORS) or {}
+
 def extract_key_value_pairs(driver, container_selector, key_selector=".key", value_selector=".value"):
     """Extract key-value pairs from a container and return as JSON object."""
     try:
-        container = driver.find_element(By.CSS_SELECTOR, container_selector)
-        key_elements = container.find_elements(By.CSS_SELECTOR, key_selector)
-        value_elements = container.find_elements(By.CSS_SELECTOR, value_selector)
+        # Pair the i-th key with the i-th value in the browser and return trimmed [key, value] pairs
+        pairs = driver.execute_script("""
+            const [containerSel, keySel, valueSel] = arguments;
+            const container = document.querySelector(containerSel);
+            if (!container) throw new Error('no such element: ' + containerSel);
+            const values = container.querySelectorAll(valueSel);
+            return Array.from(container.querySelectorAll(keySel))
+                .slice(0, values.length)
+                .map((key, i) => [key.innerText.trim(), values[i].innerText.trim()]);
+        """, container_selector, key_selector, value_selector) or []
         
-        data = {}
-        for i, key_elem in enumerate(key_elements):
-            if i < len(value_elements):
-                key = key_elem.text.strip()
-                value = value_elements[i].text.strip()
-                if key and value:
-                    data[key] = value
-        
-        return json.dumps(data) if data else "{}"
+        data = {key: value for key, value in pairs if key and value}
+        return _dumps(data) if data else "{}"
     except Exception as e:
-        print(f"  ⚠️ Key-value extraction failed: {e}")
+        logger.warning("  ⚠️ Key-value extraction failed: %s", e)
         return "{}"
 
+def _extract_kv(driver, container_sel, row_sel, key_sel, value_sel):
+    """Collect key/value pairs from rows (optionally inside a container) in one execute_script call."""
+    return driver.execute_script("""
+        const [containerSel, rowSel, keySel, valueSel] = arguments;
+        const root = containerSel ? document.querySelector(containerSel) : document;
+        const data = {};
+        if (!root) return data;
+        for (const row of root.querySelectorAll(rowSel)) {
+            const keyElem = row.querySelector(keySel);
+            const valueElem = row.querySelector(valueSel);
+            if (!keyElem || !valueElem) continue;
+            const key = keyElem.innerText.trim().replace(/:+$/, '');
+            const value = valueElem.innerText.trim();
+            if (key && value) data[key] = value;
+        }
+        return data;
+    """, container_sel, row_sel, key_sel, value_sel) or {}
+
 def extract_legal_description_json(driver):
     """Extract legal description data as structured JSON."""
     try:
-        # Look for key-value pairs in the legal description section
-        legal_data = {}
-        
-        # Try to find structured data elements
-        try:
-            # Look for specific legal description fields
-            rpd = safe_get_text(driver, By.CSS_SELECTOR, '[data-testid="legal-rpd"] .attr-value')
-            zoning = safe_get_text(driver, By.CSS_SELECTOR, '[data-testid="legal-zoning"] .attr-value')
-            title_ref = safe_get_text(driver, By.CSS_SELECTOR, '[data-testid="legal-title-ref"] .attr-value')
-            title_indicator = safe_get_text(driver, By.CSS_SELECTOR, '[data-testid="legal-title-indicator"] .attr-value')
-            la = safe_get_text(driver, By.CSS_SELECTOR, '[data-testid="legal-la"] .attr-value')
-            issue_date = safe_get_text(driver, By.CSS_SELECTOR, '[data-testid="legal-issue-date"] .attr-value')
-            fee_code = safe_get_text(driver, By.CSS_SELECTOR, '[data-testid="legal-fee-code"] .attr-value')
-            
-            if rpd: legal_data["RPD"] = rpd
-            if zoning: legal_data["Zoning"] = zoning
-            if title_ref: legal_data["Title Ref"] = title_ref
-            if title_indicator: legal_data["Title Indicator"] = title_indicator
-            if la: legal_data["LA"] = la
-            if issue_date: legal_data["Issue Date"] = issue_date
-            if fee_code: legal_data["Fee Code"] = fee_code
-            
-        except Exception as e:
-            print(f"  ⚠️ Structured legal data extraction failed: {e}")
+        # Look for specific legal description fields first
+        legal_data = {key: value for key, value in read_texts(driver, LEGAL_FIELD_SELECTORS).items() if value}
         
         # Fallback: try to extract from any key-value pairs in the legal description area
         if not legal_data:
             try:
-                legal_container = driver.find_element(By.CSS_SELECTOR, '#legal-description, .legal-description, [data-testid="legal-description"]')
-                # Look for any structured data within
-                rows = legal_container.find_elements(By.CSS_SELECTOR, 'tr, .row, .field')
-                for row in rows:
-                    try:
-                        key_elem = row.find_element(By.CSS_SELECTOR, 'td:first-child, .key, .label, strong')
-                        value_elem = row.find_element(By.CSS_SELECTOR, 'td:last-child, .value, .data')
-                        key = key_elem.text.strip().rstrip(':')
-                        value = value_elem.text.strip()
-                        if key and value:
-                            legal_data[key] = value
-                    except:
-                        continue
+                legal_data = _extract_kv(driver, *_EXTRACTORS['legal'])
             except Exception as e:
-                print(f"  ⚠️ Fallback legal data extraction failed: {e}")
+                logger.warning("  ⚠️ Fallback legal data extraction failed: %s", e)
         
-        return json.dumps(legal_data) if legal_data else "{}"
+        return _dumps(legal_data) if legal_data else "{}"
     except Exception as e:
-        print(f"  ❌ Legal description JSON extraction failed: {e}")
+        logger.error("  ❌ Legal description JSON extraction failed: %s", e)
         return "{}"
 
 def extract_property_features_json(driver):
     """Extract property features as structured JSON."""
     try:
-        features_data = {}
-        
-        # Try to extract structured property features
-        try:
-            # Look for property feature elements
-            feature_elements = driver.find_elements(By.CSS_SELECTOR, '[data-testid="property-feature"], .property-feature, .feature-item')
-            for feature in feature_elements:
-                try:
-                    key_elem = feature.find_element(By.CSS_SELECTOR, '.feature-name, .feature-key, strong, .label')
-                    value_elem = feature.find_element(By.CSS_SELECTOR, '.feature-value, .feature-data, .value')
-                    key = key_elem.text.strip().rstrip(':')
-                    value = value_elem.text.strip()
-                    if key and value:
-                        features_data[key] = value
-                except:
-                    continue
-        except Exception as e:
-            print(f"  ⚠️ Structured features extraction failed: {e}")
-        
-        return json.dumps(features_data) if features_data else "{}"
+        features_data = _extract_kv(driver, *_EXTRACTORS['features'])
+        return _dumps(features_data) if features_data else "{}"
     except Exception as e:
-        print(f"  ❌ Property features JSON extraction failed: {e}")
+        logger.error("  ❌ Property features JSON extraction failed: %s", e)
         return "{}"
 
 def extract_land_values_json(driver):
     """Extract land values as structured JSON."""
     try:
-        land_values_data = {}
-        
-        # Try to extract structured land value data
-        try:
-            # Look for land value elements
-            value_elements = driver.find_elements(By.CSS_SELECTOR, '[data-testid="land-value"], .land-value, .value-item')
-            for value_item in value_elements:
-                try:
-                    key_elem = value_item.find_element(By.CSS_SELECTOR, '.value-name, .value-key, strong, .label')
-                    value_elem = value_item.find_element(By.CSS_SELECTOR, '.value-amount, .value-data, .value')
-                    key = key_elem.text.strip().rstrip(':')
-                    value = value_elem.text.strip()
-                    if key and value:
-                        land_values_data[key] = value
-                except:
-                    continue
-        except Exception as e:
-            print(f"  ⚠️ Structured land values extraction failed: {e}")
-        
-        return json.dumps(land_values_data) if land_values_data else "{}"
+        land_values_data = _extract_kv(driver, *_EXTRACTORS['land_values'])
+        return _dumps(land_values_data) if land_values_data else "{}"
     except Exception as e:
-        print(f"  ❌ Land values JSON extraction failed: {e}")
+        logger.error("  ❌ Land values JSON extraction failed: %s", e)
         return "{}"
 
-def extract_property_history_json(driver, tab_name):
-    """Extract property history as structured JSON."""
+def read_timeline_rows(driver):
+    """Return every timeline item's date, description, details and full text in one round-trip."""
+    return driver.execute_script(
+        TIMELINE_ROWS_JS, TIMELINE_ITEM_SELECTORS, TIMELINE_DATE_SELECTORS, TIMELINE_DESC_SELECTORS, TIMELINE_DETAIL_SELECTORS
+    ) or []
+
+def extract_property_history_json(driver, tab_name, timeline_rows=None):
+    """Extract property history as structured JSON, reading the timeline unless rows are passed in."""
     try:
         history_data = {
             "events": [],
@@ -197,341 +912,200 @@ def extract_property_history_json(driver, tab_name):
             }
         }
         
-        # Try to find timeline items
-        timeline_items = []
-        timeline_selectors = [
-            '.property-timeline__timeline--tab-content ul li',
-            '.property-timeline__timeline--tab-content li',
-            '.timeline--tab-content ul li',
-            '.timeline--tab-content li',
-            '[data-testid="timeline-item"]',
-            '.timeline-item'
-        ]
-        
-        for selector in timeline_selectors:
-            try:
-                timeline_items = driver.find_elements(By.CSS_SELECTOR, selector)
-                if timeline_items:
-                    break
-            except:
-                continue
+        if timeline_rows is None:
+            timeline_rows = read_timeline_rows(driver)
         
-        for item in timeline_items:
+        for row in timeline_rows:
             try:
                 event = {}
                 
-                # Extract date
-                date_selectors = ['.date-circle .circle', '.date-circle', '.timeline-date', '.date', '[data-testid="timeline-date"]']
-                for date_selector in date_selectors:
-                    try:
-                        date_elem = item.find_element(By.CSS_SELECTOR, date_selector)
-                        event["date"] = date_elem.text.strip()
-                        break
-                    except:
-                        continue
-                
-                # Extract event type/description
-                desc_selectors = ['.prop-info .heading', '.prop-info .title', '.timeline-title', '.heading', '.title', '[data-testid="timeline-title"]']
-                for desc_selector in desc_selectors:
-                    try:
-                        desc_elem = item.find_element(By.CSS_SELECTOR, desc_selector)
-                        event["description"] = desc_elem.text.strip()
-                        break
-                    except:
-                        continue
-                
-                # Extract details
-                details = []
-                detail_selectors = ['.prop-info .details', '.timeline-details', '.details', '.info']
-                for detail_selector in detail_selectors:
-                    try:
-                        detail_elems = item.find_elements(By.CSS_SELECTOR, detail_selector)
-                        for detail in detail_elems:
-                            detail_text = detail.text.strip()
-                            if detail_text:
-                                details.append(detail_text)
-                        if details:
-                            break
-                    except:
-                        continue
-                
-                if details:
-                    event["details"] = details
+                # Date and description are null when the item has no such element
+                if row.get("date") is not None:
+                    event["date"] = row["date"]
+                if row.get("description") is not None:
+                    event["description"] = row["description"]
+                if row.get("details"):
+                    event["details"] = row["details"]
                 
-                # Determine event type
-                if event.get("description", "").lower() in ["sold", "sale"]:
-                    event["type"] = "sale"
-                    if not history_data["summary"]["last_sale"]:
-                        history_data["summary"]["last_sale"] = event
-                elif event.get("description", "").lower() in ["rented", "rental", "lease"]:
-                    event["type"] = "rental"
-                    if not history_data["summary"]["last_rental"]:
-                        history_data["summary"]["last_rental"] = event
-                elif event.get("description", "").lower() in ["listed", "listing"]:
-                    event["type"] = "listing"
-                    if not history_data["summary"]["last_listing"]:
-                        history_data["summary"]["last_listing"] = event
-                else:
-                    event["type"] = "other"
+                # Determine event type and keep the first event of each type in the summary
+                event_type = EVENT_TYPE_MAP.get(event.get("description", "").lower(), "other")
+                event["type"] = event_type
+                if event_type != "other" and not history_data["summary"]["last_" + event_type]:
+                    history_data["summary"]["last_" + event_type] = event
                 
                 if event.get("date") or event.get("description"):
                     history_data["events"].append(event)
                     
             except Exception as e:
-                print(f"⚠️ Error extracting timeline item: {e}")
+                logger.warning("⚠️ Error extracting timeline item: %s", e)
                 continue
         
         history_data["summary"]["total_events"] = len(history_data["events"])
         
-        return json.dumps(history_data) if history_data["events"] else "{}"
+        return _dumps(history_data) if history_data["events"] else "{}"
     except Exception as e:
-        print(f"  ❌ Property history JSON extraction failed: {e}")
+        logger.error("  ❌ Property history JSON extraction failed: %s", e)
         return "{}"
 
+@lru_cache(maxsize=AGENT_TEXT_CACHE_SIZE)
+def parse_agent_info_text(desc_text):
+    """Parse agent fields out of a listing description's text; cached, since agencies reuse the same boilerplate.
+    
+    Returns (field, value) pairs; build a fresh dict from them so callers never share the cached result.
+    """
+    agent_info = {}
+    
+    # First, look for the "Advertising Agency", "Advertising Agent" and "Agent Phone Number"
+    # labels in one scan, keeping the first value found for each
+    for label_match in _RE_AGENT_LABELS.finditer(desc_text):
+        field = label_match.lastgroup
+        if field not in agent_info:
+            agent_info[field] = label_match.group(field).strip()
+    
+    # If we found structured data, skip the pattern matching
+    if agent_info:
+        logger.info("  ✅ Found structured agent info in description")
+    else:
+        # Fallback to pattern matching if structured labels not found
+        logger.debug("  🔍 Using pattern matching fallback for agent info")
+    
+        # Look for a phone number in any of the supported formats, unless there are too few digits for one
+        phone_match = _PHONE_RE.search(desc_text) if sum(map(str.isdigit, desc_text)) >= _PHONE_DIGITS else None
+        if phone_match:
+            agent_info['agent_phone'] = phone_match.group(1)
+    
+        # Look for agency names (more specific patterns), unless the text is too short for any of them
+        for pattern in (_AGENCY_PATTERNS if len(desc_text) >= _MIN_AGENCY_LEN else ()):
+            agency_match = pattern.search(desc_text)
+            if agency_match:
+                agency_name = agency_match.group(1)
+                # Filter out common false positives
+                if _AGENCY_BLOCKLIST.isdisjoint(_WORD_RE.findall(agency_name.lower())):
+                    agent_info['advertising_agency'] = agency_name
+                    break
+    
+        # Look for agent names (more specific patterns)
+        for pattern in _AGENT_PATTERNS:
+            agent_match = pattern.search(desc_text)
+            if agent_match:
+                agent_name = agent_match.group(1)
+                # Filter out common false positives
+                if _AGENT_BLOCKLIST.isdisjoint(_WORD_RE.findall(agent_name.lower())):
+                    agent_info['advertising_agent'] = agent_name
+                    break
+    
+    return tuple(agent_info.items())
+
 def extract_property_data(driver, url):
-    """Extract comprehensive property data from a single property page."""
-    print(f"🔍 Scraping property: {url}")
+    """Extract comprehensive property data from a single property page.
+
+    The driver is expected to be logged in already and is reused across calls: the caller creates one
+    driver (see create_driver and scrape_urls) and passes it for every URL instead of starting Chrome per page.
+    """
+    logger.info("🔍 Scraping property: %s", url)
     
     try:
-        print(f"🌐 Loading URL: {url}")
+        logger.info("🌐 Loading URL: %s", url)
         driver.get(url)
         
-        # Wait for initial page load
-        time.sleep(5)
+        # Wait for the DOM to be parsed instead of a fixed sleep
+        try:
+            WebDriverWait(driver, 20).until(lambda d: d.execute_script("return document.readyState") != "loading")
+        except TimeoutException:
+            logger.warning("⚠️ Document not parsed after 20 seconds, continuing anyway...")
         
         # Check if page loaded successfully
         current_url = driver.current_url
-        print(f"Current URL after load: {current_url}")
+        logger.debug("Current URL after load: %s", current_url)
         
         # Check for common error pages or redirects
         if "error" in current_url.lower() or "404" in current_url.lower():
-            print("❌ Error page detected")
+            logger.error("❌ Error page detected")
             return None
         
-        # Wait for the main content to load with multiple attempts
-        max_attempts = 5
-        page_loaded = False
-        
-        for attempt in range(max_attempts):
-            try:
-                print(f"⏳ Waiting for page content (attempt {attempt + 1}/{max_attempts})")
-                
-                # Try multiple selectors for the main content
-                selectors_to_try = [
-                    (By.ID, "attr-single-line-address"),
-                    (By.CSS_SELECTOR, "[data-testid='property-attr-bed']"),
-                    (By.CSS_SELECTOR, ".image-gallery"),
-                    (By.CSS_SELECTOR, "h4"),
-                    (By.TAG_NAME, "body")
-                ]
-                
-                for by, selector in selectors_to_try:
-                    try:
-                        WebDriverWait(driver, 10).until(
-                            EC.presence_of_element_located((by, selector))
-                        )
-                        print(f"✅ Found content with selector: {selector}")
-                        page_loaded = True
-                        break
-                    except:
-                        continue
-                
-                if page_loaded:
-                    break
-                    
-            except Exception as e:
-                print(f"⚠️ Attempt {attempt + 1} failed: {e}")
-                if attempt < max_attempts - 1:
-                    print(f"Retrying in 3 seconds...")
-                    time.sleep(3)
-                else:
-                    print("⚠️ Main content not loaded after all attempts, continuing anyway...")
-        
-        # Additional wait for dynamic content
-        time.sleep(5)
+        # Wait for the property content rendered by the app
+        logger.info("⏳ Waiting for page content")
+        try:
+            WebDriverWait(driver, 15).until(EC.presence_of_element_located((By.ID, "attr-single-line-address")))
+            logger.info("✅ Found content with selector: attr-single-line-address")
+        except TimeoutException:
+            logger.warning("⚠️ Main content not loaded after 15 seconds, continuing anyway...")
         
-        # Scroll to ensure all content is loaded
+        # Scroll to the bottom and back to trigger lazy loading, then wait for a lazy-loaded tail element
         try:
-            driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(2)
-            driver.execute_script("window.scrollTo(0, 0);")
-            time.sleep(2)
+            driver.execute_script("window.scrollTo(0, document.body.scrollHeight); window.scrollTo(0, 0);")
+            WebDriverWait(driver, LAZY_CONTENT_TIMEOUT, poll_frequency=WAIT_POLL_FREQUENCY).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, TIMELINE_ITEM_SEL)))
+        except TimeoutException:
+            logger.warning("⚠️ Timeline not rendered after %s seconds, continuing anyway...", LAZY_CONTENT_TIMEOUT)
         except:
             pass
         
-        property_data = {
-            'Property_URL': url,
-            'Address': '',
-            'Bedrooms': '',
-            'Bathrooms': '',
-            'Car_Spaces': '',
-            'Land_Size': '',
-            'Floor_Area': '',
-            'Property_Type': '',
-            'Last_Sold_Price': '',
-            'Last_Sold_Date': '',
-            'Sold_By': '',
-            'Land_Use': '',
-            'Issue_Date': '',
-            'Advertisement_Date': '',
-            'Listing_Description': '',
-            'Advertising_Agent_Info_JSON': '',
-            'Owner_Type': '',
-            'Current_Tenure': '',
-            'Title_Indicator': '',
-            'LA': '',
-            'Properties_Sold_12_Months': '',
-            'Property_History_All': '',
-            'Property_History_Sale': '',
-            'Property_History_Listing': '',
-            'Property_History_Rental': '',
-            'Property_History_DA': '',
-            'Natural_Risks': '',
-            'Valuation_Estimate_Estimate': '',
-            'Valuation_Estimate_Estimate_JSON': '',
-            'Valuation_Estimate_Rental': '',
-            'Valuation_Estimate_Rental_JSON': '',
-            'Nearby_Schools_In_Catchment': '',
-            'Nearby_Schools_All_Nearby': '',
-            'Additional_Information_Legal_Description': '',
-            'Additional_Information_Property_Features': '',
-            'Additional_Information_Land_Values': '',
-            'Household_Information_Owner_Information': '',
-            'Household_Information_Marketing_Contacts': '',
-            # JSON structured data columns
-            'Property_Attributes_JSON': '',
-            'Sale_Information_JSON': '',
-            'Natural_Risks_JSON': '',
-            'Scraping_Date': time.strftime('%Y-%m-%d %H:%M:%S')
-        }
+        property_data = _ROW_TEMPLATE.copy()
+        property_data['Property_URL'] = url
+        property_data['Scraping_Date'] = time.strftime('%Y-%m-%d %H:%M:%S')
         
         # Debug: Check what elements are available
-        print("🔍 Debugging page elements...")
+        logger.debug("🔍 Debugging page elements...")
         try:
             # Check if address element exists
             address_elements = driver.find_elements(By.ID, "attr-single-line-address")
-            print(f"  Address elements found: {len(address_elements)}")
+            logger.debug("  Address elements found: %d", len(address_elements))
             
             # Check for any h4 elements
             h4_elements = driver.find_elements(By.TAG_NAME, "h4")
-            print(f"  H4 elements found: {len(h4_elements)}")
+            logger.debug("  H4 elements found: %d", len(h4_elements))
             
             # Check for property attributes
             bed_elements = driver.find_elements(By.CSS_SELECTOR, '[data-testid="property-attr-bed"]')
-            print(f"  Bedroom elements found: {len(bed_elements)}")
+            logger.debug("  Bedroom elements found: %d", len(bed_elements))
             
             
         except Exception as e:
-            print(f"  Debug error: {e}")
+            logger.debug("  Debug error: %s", e)
         
         # Extract address from URL instead of scraping
         try:
             # Parse address from URL: https://rpp.corelogic.com.au/property/440-323-greens-road-mambourin-vic-3024/57145835
             # Extract the part between '/property/' and the last '/'
-            url_parts = url.split('/property/')
-            if len(url_parts) > 1:
-                address_part = url_parts[1].split('/')[0]  # Get part before the ID
-                # Replace hyphens with spaces and capitalize
-                address_text = address_part.replace('-', ' ').title()
+            address_match = _ADDRESS_SLUG_RE.search(url)
+            if address_match:
+                # Capitalize each word, keeping state codes such as VIC in upper case
+                address_text = ' '.join(
+                    word.upper() if word in _STATE_CODES else word.capitalize()
+                    for word in address_match.group(1).split('-')
+                )
                 property_data['Address'] = address_text
-                print(f"  ✅ Address extracted from URL: {address_text}")
+                logger.info("  ✅ Address extracted from URL: %s", address_text)
             else:
                 property_data['Address'] = ''
-                print(f"  ❌ Could not parse address from URL: {url}")
+                logger.error("  ❌ Could not parse address from URL: %s", url)
         except Exception as e:
             property_data['Address'] = ''
-            print(f"  ❌ Address extraction from URL failed: {e}")
+            logger.error("  ❌ Address extraction from URL failed: %s", e)
         
         # Extract property attributes (bedrooms, bathrooms, car spaces, land size, floor area) as JSON
-        property_attributes = {}
-        
-        try:
-            bed_container = driver.find_element(By.CSS_SELECTOR, '[data-testid="property-attr-bed"] .property-attribute-val')
-            bed_spans = bed_container.find_elements(By.TAG_NAME, 'span')
-            if len(bed_spans) > 1:
-                bedrooms = bed_spans[1].text.strip()
-                property_data['Bedrooms'] = bedrooms
-                property_attributes['bedrooms'] = bedrooms
-            else:
-                property_data['Bedrooms'] = '-'
-                property_attributes['bedrooms'] = '-'
-            print(f"  ✅ Bedrooms extracted: {property_data['Bedrooms']}")
-        except Exception as e:
-            property_data['Bedrooms'] = '-'
-            property_attributes['bedrooms'] = '-'
-            print(f"  ❌ Bedrooms extraction failed: {e}")
-            
-        try:
-            bath_container = driver.find_element(By.CSS_SELECTOR, '[data-testid="property-attr-bath"] .property-attribute-val')
-            bath_spans = bath_container.find_elements(By.TAG_NAME, 'span')
-            if len(bath_spans) > 1:
-                bathrooms = bath_spans[1].text.strip()
-                property_data['Bathrooms'] = bathrooms
-                property_attributes['bathrooms'] = bathrooms
-            else:
-                property_data['Bathrooms'] = '-'
-                property_attributes['bathrooms'] = '-'
-        except:
-            property_data['Bathrooms'] = '-'
-            property_attributes['bathrooms'] = '-'
-            
-        try:
-            car_container = driver.find_element(By.CSS_SELECTOR, '[data-testid="property-attr-car"] .property-attribute-val')
-            car_spans = car_container.find_elements(By.TAG_NAME, 'span')
-            if len(car_spans) > 1:
-                car_spaces = car_spans[1].text.strip()
-                property_data['Car_Spaces'] = car_spaces
-                property_attributes['car_spaces'] = car_spaces
-            else:
-                property_data['Car_Spaces'] = '-'
-                property_attributes['car_spaces'] = '-'
-        except:
-            property_data['Car_Spaces'] = '-'
-            property_attributes['car_spaces'] = '-'
-            
-        try:
-            land_container = driver.find_element(By.CSS_SELECTOR, '[data-testid="val-land-area"]')
-            land_spans = land_container.find_elements(By.TAG_NAME, 'span')
-            if len(land_spans) > 1:
-                land_size = land_spans[1].text.strip()
-                property_data['Land_Size'] = land_size
-                property_attributes['land_size'] = land_size
-            else:
-                property_data['Land_Size'] = '-'
-                property_attributes['land_size'] = '-'
-        except:
-            property_data['Land_Size'] = '-'
-            property_attributes['land_size'] = '-'
-            
-        try:
-            floor_container = driver.find_element(By.CSS_SELECTOR, '[data-testid="val-floor-area"]')
-            floor_spans = floor_container.find_elements(By.TAG_NAME, 'span')
-            if len(floor_spans) > 1:
-                floor_area = floor_spans[1].text.strip()
-                property_data['Floor_Area'] = floor_area
-                property_attributes['floor_area'] = floor_area
-            else:
-                property_data['Floor_Area'] = '-'
-                property_attributes['floor_area'] = '-'
-        except:
-            property_data['Floor_Area'] = '-'
-            property_attributes['floor_area'] = '-'
+        property_attributes = read_attribute_values(driver, PROPERTY_ATTRIBUTE_SELECTORS)
+        for attribute_key, column_name in PROPERTY_ATTRIBUTE_COLUMNS.items():
+            property_data[column_name] = property_attributes[attribute_key]
+        logger.info("  ✅ Bedrooms extracted: %s", property_data['Bedrooms'])
         
         # Store property attributes as JSON
-        property_data['Property_Attributes_JSON'] = json.dumps(property_attributes)
+        property_data['Property_Attributes_JSON'] = _dumps(property_attributes)
         
-        # Extract property type
-        property_type = safe_get_text(driver, By.ID, "attr-property-type")
-        property_data['Property_Type'] = property_type
+        # Read the static text fields in a single round-trip
+        static_texts = read_texts(driver, STATIC_FIELD_SELECTORS)
+        for field in ('Property_Type', 'Sold_By', 'Land_Use', 'Issue_Date', 'Advertisement_Date',
+                      'Owner_Type', 'Current_Tenure', 'Properties_Sold_12_Months'):
+            property_data[field] = static_texts.get(field, '')
         
         # Extract sale information as JSON
         try:
             sale_data = {}
-            sale_price_elem = driver.find_element(By.CSS_SELECTOR, '.sale-price')
-            sale_text = sale_price_elem.text.strip()
+            sale_text = static_texts.get('Sale_Text', '')
             # Extract price and date from text like "Last Sold on 01 May 2025 for $227,000,000"
-            price_match = re.search(r'\$([0-9,]+)', sale_text)
-            date_match = re.search(r'(\d{1,2} \w+ \d{4})', sale_text)
+            price_match = _PRICE_RE.search(sale_text)
+            date_match = _DATE_RE.search(sale_text)
             
             if price_match:
                 sale_data['price'] = price_match.group(1).replace(',', '')
@@ -542,222 +1116,46 @@ def extract_property_data(driver, url):
             
             # Store as JSON for structured access
             if sale_data:
-                property_data['Sale_Information_JSON'] = json.dumps(sale_data)
+                property_data['Sale_Information_JSON'] = _dumps(sale_data)
         except:
             pass
         
-        # Extract sale details
+        # Extract listing description, expanding "Show More" in the same browser call
         try:
-            sold_by = safe_get_text(driver, By.CSS_SELECTOR, '[data-testid="sale-detail-sold-by"] .property-attribute-val')
-            property_data['Sold_By'] = sold_by
-        except:
-            pass
-            
-        try:
-            land_use = safe_get_text(driver, By.CSS_SELECTOR, '[data-testid="sale-detail-land-use"] .property-attribute-val')
-            property_data['Land_Use'] = land_use
-        except:
-            pass
-            
-        try:
-            issue_date = safe_get_text(driver, By.CSS_SELECTOR, '[data-testid="sale-detail-issue-date"] .property-attribute-val')
-            property_data['Issue_Date'] = issue_date
-        except:
-            pass
-        
-        # Extract advertisement date
-        try:
-            ad_date = safe_get_text(driver, By.CSS_SELECTOR, '[data-testid="advertisement-date"] .attr-value')
-            property_data['Advertisement_Date'] = ad_date
-        except:
-            pass
-        
-        # Extract listing description with "Show More" functionality
-        try:
-            # First try to find the listing description element
-            desc_elem = driver.find_element(By.CSS_SELECTOR, '[data-testid="listing-desc"]')
-            
-            # Check if there's a "Show More" link and click it to get full description
-            try:
-                show_more_link = desc_elem.find_element(By.CSS_SELECTOR, 'a[href="#"], .show-more, [data-testid="show-more"]')
-                if show_more_link and show_more_link.is_displayed():
-                    print("  🔍 Found 'Show More' link, clicking to expand description...")
-                    driver.execute_script("arguments[0].click();", show_more_link)
-                    time.sleep(2)  # Wait for content to expand
-            except NoSuchElementException:
-                # No "Show More" link found, continue with current content
-                pass
+            listing_desc = driver.execute_async_script(LISTING_DESCRIPTION_JS)
+            if not listing_desc['found']:
+                raise NoSuchElementException('[data-testid="listing-desc"] not found')
+            if listing_desc['expanded']:
+                logger.debug("  🔍 Expanded 'Show More' in listing description")
             
             # Get the full description text
-            property_data['Listing_Description'] = desc_elem.text.strip()
-            print(f"  ✅ Listing description extracted: {len(property_data['Listing_Description'])} characters")
+            property_data['Listing_Description'] = listing_desc['text']
+            logger.info("  ✅ Listing description extracted: %d characters", len(property_data['Listing_Description']))
         except Exception as e:
-            print(f"  ❌ Listing description extraction failed: {e}")
+            logger.error("  ❌ Listing description extraction failed: %s", e)
             property_data['Listing_Description'] = ''
         
-        # Extract owner type
-        try:
-            owner_type = safe_get_text(driver, By.CSS_SELECTOR, '.owner-type')
-            property_data['Owner_Type'] = owner_type
-        except:
-            pass
-        
-        # Extract current tenure
-        try:
-            tenure = safe_get_text(driver, By.CSS_SELECTOR, '.tenure')
-            property_data['Current_Tenure'] = tenure
-        except:
-            pass
-        
         # Extract advertising agent information from listing description
         try:
-            # Look for advertising agent information in the listing description area
-            agent_info = {}
-            
-            # Try multiple selectors for advertising agency
-            agency_selectors = [
-                '[data-testid="listing-desc"] .advertising-agency',
-                '.listing-desc .advertising-agency',
-                '[data-testid="listing-desc"] .agency',
-                '.listing-desc .agency',
-                '[data-testid="listing-desc"] .advertising-agency-name',
-                '.listing-desc .advertising-agency-name'
-            ]
-            
-            for selector in agency_selectors:
-                try:
-                    agency_elem = driver.find_element(By.CSS_SELECTOR, selector)
-                    if agency_elem and agency_elem.text.strip():
-                        agent_info['advertising_agency'] = agency_elem.text.strip()
-                        break
-                except NoSuchElementException:
-                    continue
-            
-            # Try multiple selectors for advertising agent name
-            agent_selectors = [
-                '[data-testid="listing-desc"] .advertising-agent',
-                '.listing-desc .advertising-agent',
-                '[data-testid="listing-desc"] .agent-name',
-                '.listing-desc .agent-name',
-                '[data-testid="listing-desc"] .advertising-agent-name',
-                '.listing-desc .advertising-agent-name'
-            ]
-            
-            for selector in agent_selectors:
-                try:
-                    agent_elem = driver.find_element(By.CSS_SELECTOR, selector)
-                    if agent_elem and agent_elem.text.strip():
-                        agent_info['advertising_agent'] = agent_elem.text.strip()
-                        break
-                except NoSuchElementException:
-                    continue
-            
-            # Try multiple selectors for agent phone number
-            phone_selectors = [
-                '[data-testid="listing-desc"] .agent-phone',
-                '.listing-desc .agent-phone',
-                '[data-testid="listing-desc"] .phone',
-                '.listing-desc .phone',
-                '[data-testid="listing-desc"] .agent-phone-number',
-                '.listing-desc .agent-phone-number'
-            ]
-            
-            for selector in phone_selectors:
-                try:
-                    phone_elem = driver.find_element(By.CSS_SELECTOR, selector)
-                    if phone_elem and phone_elem.text.strip():
-                        agent_info['agent_phone'] = phone_elem.text.strip()
-                        break
-                except NoSuchElementException:
-                    continue
+            # Look for advertising agent information in the listing description area, every field in one call
+            agent_info = {field: text for field, text in read_agent_fields(driver).items() if text}
             
             # If no agent info found via selectors, try to extract from listing description text
             if not agent_info and property_data.get('Listing_Description'):
                 try:
-                    desc_text = property_data['Listing_Description']
-                    
-                    # Look for common patterns in the description text
-                    import re
-                    
-                    # First, try to find the agent section by looking for "Advertising Agency" label
-                    agency_section_match = re.search(r'Advertising Agency[:\s]*([^\n\r]+)', desc_text, re.IGNORECASE)
-                    if agency_section_match:
-                        agent_info['advertising_agency'] = agency_section_match.group(1).strip()
-                    
-                    # Look for "Advertising Agent" label
-                    agent_section_match = re.search(r'Advertising Agent[:\s]*([^\n\r]+)', desc_text, re.IGNORECASE)
-                    if agent_section_match:
-                        agent_info['advertising_agent'] = agent_section_match.group(1).strip()
-                    
-                    # Look for "Agent Phone Number" label
-                    phone_section_match = re.search(r'Agent Phone Number[:\s]*([^\n\r]+)', desc_text, re.IGNORECASE)
-                    if phone_section_match:
-                        agent_info['agent_phone'] = phone_section_match.group(1).strip()
-                    
-                    # If we found structured data, skip the pattern matching
-                    if agent_info:
-                        print(f"  ✅ Found structured agent info in description")
-                    else:
-                        # Fallback to pattern matching if structured labels not found
-                        print(f"  🔍 Using pattern matching fallback for agent info")
-                        
-                        # Look for phone number patterns
-                        phone_patterns = [
-                            r'(\d{4}\s\d{3}\s\d{3})',  # 0439 431 020
-                            r'(\d{4}\s\d{3}\s\d{3})',  # 0451 065 565
-                            r'(\d{10})',  # 0439431020
-                            r'(\d{4}\.\d{3}\.\d{3})'   # 0439.431.020
-                        ]
-                        
-                        for pattern in phone_patterns:
-                            phone_match = re.search(pattern, desc_text)
-                            if phone_match:
-                                agent_info['agent_phone'] = phone_match.group(1)
-                                break
-                        
-                        # Look for agency names (more specific patterns)
-                        agency_patterns = [
-                            r'(RT Edgar \w+)',
-                            r'([A-Z][a-z]+\s+[A-Z][a-z]+\s+(?:Realty|Property|Estate|Group|Agency))',
-                            r'([A-Z][a-z]+\s+[A-Z][a-z]+\s+[A-Z][a-z]+)'  # Three word agency names
-                        ]
-                        
-                        for pattern in agency_patterns:
-                            agency_match = re.search(pattern, desc_text)
-                            if agency_match:
-                                agency_name = agency_match.group(1)
-                                # Filter out common false positives
-                                if not any(word in agency_name.lower() for word in ['expressions', 'interest', 'closing', 'monday', 'september', 'melbourne', 'location', 'access', 'public', 'transport']):
-                                    agent_info['advertising_agency'] = agency_name
-                                    break
-                        
-                        # Look for agent names (more specific patterns)
-                        agent_patterns = [
-                            r'(Sarah Case|Will Hocking)',  # Specific known agents
-                            r'([A-Z][a-z]+\s+[A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)'  # General name pattern
-                        ]
-                        
-                        for pattern in agent_patterns:
-                            agent_match = re.search(pattern, desc_text)
-                            if agent_match:
-                                agent_name = agent_match.group(1)
-                                # Filter out common false positives
-                                if not any(word in agent_name.lower() for word in ['expressions', 'interest', 'closing', 'monday', 'september', 'melbourne', 'location', 'access', 'public', 'transport', 'victorian', 'terrace', 'soaring', 'ceilings', 'retaining', 'original', 'features', 'pressed', 'metal', 'ornate', 'cornice', 'stain', 'glass', 'windows', 'tessellated', 'tiles', 'arched', 'entry', 'hall']):
-                                    agent_info['advertising_agent'] = agent_name
-                                    break
-                    
+                    agent_info.update(parse_agent_info_text(property_data['Listing_Description']))
                 except Exception as text_extract_error:
-                    print(f"  ⚠️ Text-based agent extraction failed: {text_extract_error}")
+                    logger.warning("  ⚠️ Text-based agent extraction failed: %s", text_extract_error)
             
             # Store agent information as JSON if found
             if agent_info:
-                property_data['Advertising_Agent_Info_JSON'] = json.dumps(agent_info)
-                print(f"  ✅ Advertising agent info extracted: {len(agent_info)} fields")
+                property_data['Advertising_Agent_Info_JSON'] = _dumps(agent_info)
+                logger.info("  ✅ Advertising agent info extracted: %d fields", len(agent_info))
             else:
                 property_data['Advertising_Agent_Info_JSON'] = ''
-                print(f"  ℹ️ No advertising agent information found")
+                logger.info("  ℹ️ No advertising agent information found")
         except Exception as e:
-            print(f"  ⚠️ Advertising agent info extraction failed: {e}")
+            logger.warning("  ⚠️ Advertising agent info extraction failed: %s", e)
             property_data['Advertising_Agent_Info_JSON'] = ''
         
         # Extract Additional Information - separate tabs (Legal Description, Property Features, Land Values)
@@ -768,218 +1166,93 @@ def extract_property_data(driver, url):
                 'Land Values': 'Additional_Information_Land_Values'
             }
             
+            # Resolve every tab menu once, then look each tab up by name
+            tab_menus = find_tab_menus(driver)
+            
             for tab_name, column_name in additional_tabs.items():
                 try:
                     # Try to click on the specific tab
-                    tab_element = driver.find_element(By.CSS_SELECTOR, f'[data-testid="crux-tab-menu-{tab_name}"]')
-                    if tab_element and tab_element.is_enabled():
+                    tab_element = tab_menus.get(tab_name)
+                    if tab_element is None:
+                        property_data[column_name] = 'Tab not available'
+                        logger.warning("  ⚠️ %s tab not available", tab_name)
+                        continue
+                    if tab_element.is_enabled():
                         driver.execute_script("arguments[0].click();", tab_element)
-                        time.sleep(3)  # Wait for content to load
+                        # Wait for this tab's content to render instead of a fixed sleep
+                        wait_and_get_text_js(driver, ADDITIONAL_TAB_CONTAINERS.get(tab_name, '#additional-information-view .tab-content'))
                         
                         # Extract structured data based on tab type
                         if tab_name == 'Legal Description':
                             # Extract legal description data
                             legal_data = {}
                             
-                            # Get all legal description rows
-                            legal_rows = driver.find_elements(By.CSS_SELECTOR, '#legal-description .legal-desc-row')
+                            # Read every legal description row's label and content in one call
+                            legal_rows = read_row_pairs(driver, LEGAL_ROW_SELECTORS, ['.flex-label p'], ['.flex-content p'])
                             
-                            for row in legal_rows:
-                                try:
-                                    label_elem = row.find_element(By.CSS_SELECTOR, '.flex-label p')
-                                    content_elem = row.find_element(By.CSS_SELECTOR, '.flex-content p')
-                                    
-                                    label = label_elem.text.strip()
-                                    content = content_elem.text.strip()
-                                    
-                                    # Clean up content (remove tooltip icons, etc.)
-                                    if 'Withheld' in content:
-                                        content = 'Withheld'
-                                    
-                                    if label and content:
-                                        legal_data[label] = content
-                                        
-                                except Exception as row_error:
-                                    print(f"  ⚠️ Error extracting legal row: {row_error}")
-                                    continue
+                            for label, content in legal_rows['pairs']:
+                                # Clean up content (remove tooltip icons, etc.)
+                                if 'Withheld' in content:
+                                    content = 'Withheld'
+                                
+                                if label and content:
+                                    legal_data[label] = content
                             
-                            content = json.dumps(legal_data) if legal_data else "{}"
+                            content = _dumps(legal_data) if legal_data else "{}"
                             
                         elif tab_name == 'Property Features':
                             # Extract property features data
                             features_data = {}
                             
-                            # Try multiple selectors for property features
-                            feature_selectors = [
-                                '#property-features .flex-container',
-                                '#property-features .legal-desc-row', 
-                                '#property-features .flex-label',
-                                '.tab-content .flex-container',
-                                '.tab-content .legal-desc-row'
-                            ]
-                            
-                            feature_rows = []
-                            for selector in feature_selectors:
-                                try:
-                                    rows = driver.find_elements(By.CSS_SELECTOR, selector)
-                                    if rows:
-                                        feature_rows = rows
-                                        print(f"  🔍 Found {len(rows)} feature rows with selector: {selector}")
-                                        break
-                                except:
-                                    continue
-                            
-                            if not feature_rows:
+                            # Read the rows of the first matching selector, label and content included, in one call
+                            feature_rows = read_row_pairs(driver, FEATURE_ROW_SELECTORS)
+                            if feature_rows['selector']:
+                                logger.debug("  🔍 Found %d feature rows with selector: %s", len(feature_rows['pairs']), feature_rows['selector'])
+                                features_data = {label: content for label, content in feature_rows['pairs'] if label and content}
+                            else:
                                 # Fallback: try to get any key-value pairs in the current tab content
                                 try:
-                                    # Look for any elements that might contain property features
-                                    all_elements = driver.find_elements(By.CSS_SELECTOR, '.tab-content *')
-                                    for elem in all_elements:
-                                        try:
-                                            text = elem.text.strip()
-                                            if text and ':' in text:
-                                                parts = text.split(':', 1)
-                                                if len(parts) == 2:
-                                                    key = parts[0].strip()
-                                                    value = parts[1].strip()
-                                                    if key and value:
-                                                        features_data[key] = value
-                                        except:
-                                            continue
+                                    # Look for any elements that might contain property features, split in the browser
+                                    features_data.update(read_tab_content_pairs(driver))
                                 except Exception as fallback_error:
-                                    print(f"  ⚠️ Fallback extraction failed: {fallback_error}")
-                            
-                            for row in feature_rows:
-                                try:
-                                    # Try multiple selectors for label and content
-                                    label_selectors = ['.flex-label p', '.flex-label', 'p:first-child', '.label']
-                                    content_selectors = ['.flex-content p', '.flex-content', 'p:last-child', '.value', '.content']
-                                    
-                                    label = ""
-                                    content = ""
-                                    
-                                    for label_sel in label_selectors:
-                                        try:
-                                            label_elem = row.find_element(By.CSS_SELECTOR, label_sel)
-                                            label = label_elem.text.strip()
-                                            if label:
-                                                break
-                                        except:
-                                            continue
-                                    
-                                    for content_sel in content_selectors:
-                                        try:
-                                            content_elem = row.find_element(By.CSS_SELECTOR, content_sel)
-                                            content = content_elem.text.strip()
-                                            if content:
-                                                break
-                                        except:
-                                            continue
-                                    
-                                    if label and content:
-                                        features_data[label] = content
-                                        
-                                except Exception as row_error:
-                                    print(f"  ⚠️ Error extracting feature row: {row_error}")
-                                    continue
+                                    logger.warning("  ⚠️ Fallback extraction failed: %s", fallback_error)
                             
-                            content = json.dumps(features_data) if features_data else "{}"
+                            content = _dumps(features_data) if features_data else "{}"
                             
                         elif tab_name == 'Land Values':
                             # Extract land values data
                             values_data = {}
                             
-                            # Try multiple selectors for land values
-                            value_selectors = [
-                                '#land-values .flex-container',
-                                '#land-values .legal-desc-row',
-                                '#land-values .flex-label',
-                                '.tab-content .flex-container',
-                                '.tab-content .legal-desc-row'
-                            ]
-                            
-                            value_rows = []
-                            for selector in value_selectors:
-                                try:
-                                    rows = driver.find_elements(By.CSS_SELECTOR, selector)
-                                    if rows:
-                                        value_rows = rows
-                                        print(f"  🔍 Found {len(rows)} value rows with selector: {selector}")
-                                        break
-                                except:
-                                    continue
-                            
-                            if not value_rows:
+                            # Read the rows of the first matching selector, label and content included, in one call
+                            value_rows = read_row_pairs(driver, LAND_VALUE_ROW_SELECTORS)
+                            if value_rows['selector']:
+                                logger.debug("  🔍 Found %d value rows with selector: %s", len(value_rows['pairs']), value_rows['selector'])
+                                values_data = {label: content for label, content in value_rows['pairs'] if label and content}
+                            else:
                                 # Fallback: try to get any key-value pairs in the current tab content
                                 try:
-                                    # Look for any elements that might contain land values
-                                    all_elements = driver.find_elements(By.CSS_SELECTOR, '.tab-content *')
-                                    for elem in all_elements:
-                                        try:
-                                            text = elem.text.strip()
-                                            if text and ':' in text:
-                                                parts = text.split(':', 1)
-                                                if len(parts) == 2:
-                                                    key = parts[0].strip()
-                                                    value = parts[1].strip()
-                                                    if key and value:
-                                                        values_data[key] = value
-                                        except:
-                                            continue
+                                    # Look for any elements that might contain land values, split in the browser
+                                    values_data.update(read_tab_content_pairs(driver))
                                 except Exception as fallback_error:
-                                    print(f"  ⚠️ Fallback extraction failed: {fallback_error}")
-                            
-                            for row in value_rows:
-                                try:
-                                    # Try multiple selectors for label and content
-                                    label_selectors = ['.flex-label p', '.flex-label', 'p:first-child', '.label']
-                                    content_selectors = ['.flex-content p', '.flex-content', 'p:last-child', '.value', '.content']
-                                    
-                                    label = ""
-                                    content = ""
-                                    
-                                    for label_sel in label_selectors:
-                                        try:
-                                            label_elem = row.find_element(By.CSS_SELECTOR, label_sel)
-                                            label = label_elem.text.strip()
-                                            if label:
-                                                break
-                                        except:
-                                            continue
-                                    
-                                    for content_sel in content_selectors:
-                                        try:
-                                            content_elem = row.find_element(By.CSS_SELECTOR, content_sel)
-                                            content = content_elem.text.strip()
-                                            if content:
-                                                break
-                                        except:
-                                            continue
-                                    
-                                    if label and content:
-                                        values_data[label] = content
-                                        
-                                except Exception as row_error:
-                                    print(f"  ⚠️ Error extracting value row: {row_error}")
-                                    continue
+                                    logger.warning("  ⚠️ Fallback extraction failed: %s", fallback_error)
                             
-                            content = json.dumps(values_data) if values_data else "{}"
+                            content = _dumps(values_data) if values_data else "{}"
                         
                         else:
                             # Fallback for other tabs
                             content = safe_get_text(driver, By.CSS_SELECTOR, '#additional-information-view .tab-content')
-                            content = json.dumps({"raw_content": content}) if content else "{}"
+                            content = _dumps({"raw_content": content}) if content else "{}"
                         
                         property_data[column_name] = content if content != "{}" else 'Not available'
-                        print(f"  ✅ {tab_name} extracted: {len(content) if content else 0} characters")
+                        logger.info("  ✅ %s extracted: %s characters", tab_name, len(content) if content else 0)
                     else:
                         property_data[column_name] = 'Tab not available'
-                        print(f"  ⚠️ {tab_name} tab not available")
+                        logger.warning("  ⚠️ %s tab not available", tab_name)
                 except Exception as e:
                     property_data[column_name] = 'Not available'
-                    print(f"  ❌ {tab_name} extraction failed: {e}")
+                    logger.error("  ❌ %s extraction failed: %s", tab_name, e)
         except Exception as e:
-            print(f"  ❌ Additional information extraction failed: {e}")
+            logger.error("  ❌ Additional information extraction failed: %s", e)
         
         # Extract Household Information - separate tabs (Owner Information, Marketing Contacts)
         try:
@@ -988,33 +1261,35 @@ def extract_property_data(driver, url):
                 'Marketing Contacts': 'Household_Information_Marketing_Contacts'
             }
             
+            # Resolve every tab menu once, then look each tab up by name
+            tab_menus = find_tab_menus(driver)
+            
+            # Both tabs render into .ownership-detail, so after the first tab wait for its text to change
+            previous_content = None
             for tab_name, column_name in household_tabs.items():
                 try:
                     # Try to click on the specific tab
-                    tab_element = driver.find_element(By.CSS_SELECTOR, f'[data-testid="crux-tab-menu-{tab_name}"]')
-                    if tab_element and tab_element.is_enabled():
+                    tab_element = tab_menus.get(tab_name)
+                    if tab_element is None:
+                        property_data[column_name] = 'Tab not available'
+                        logger.warning("  ⚠️ %s tab not available", tab_name)
+                        continue
+                    if tab_element.is_enabled():
                         driver.execute_script("arguments[0].click();", tab_element)
-                        time.sleep(2)  # Wait for content to load
                         
-                        # Extract content
-                        content = safe_get_text(driver, By.CSS_SELECTOR, '.ownership-detail')
+                        # Extract content once it has rendered
+                        content = wait_and_get_text_js(driver, '.ownership-detail', previous=previous_content)
+                        previous_content = content
                         property_data[column_name] = content if content else 'Not available'
-                        print(f"  ✅ {tab_name} extracted: {len(content) if content else 0} characters")
+                        logger.info("  ✅ %s extracted: %s characters", tab_name, len(content) if content else 0)
                     else:
                         property_data[column_name] = 'Tab not available'
-                        print(f"  ⚠️ {tab_name} tab not available")
+                        logger.warning("  ⚠️ %s tab not available", tab_name)
                 except Exception as e:
                     property_data[column_name] = 'Not available'
-                    print(f"  ❌ {tab_name} extraction failed: {e}")
+                    logger.error("  ❌ %s extraction failed: %s", tab_name, e)
         except Exception as e:
-            print(f"  ❌ Household information extraction failed: {e}")
-        
-        # Extract market trends - properties sold in last 12 months
-        try:
-            properties_sold = safe_get_text(driver, By.CSS_SELECTOR, '[data-testid="metric-id-37"] .value')
-            property_data['Properties_Sold_12_Months'] = properties_sold
-        except:
-            pass
+            logger.error("  ❌ Household information extraction failed: %s", e)
         
         # Extract Property History - separate tabs (All, Sale, Listing, Rental, DA)
         try:
@@ -1029,167 +1304,76 @@ def extract_property_data(driver, url):
             # Debug: Print available timeline tabs
             try:
                 all_tabs = driver.find_elements(By.CSS_SELECTOR, '.property-timeline__timeline--tab')
-                print(f"🔍 Found {len(all_tabs)} timeline tabs:")
+                logger.debug("🔍 Found %d timeline tabs:", len(all_tabs))
                 for tab in all_tabs:
-                    print(f"  - '{tab.text}' (class: {tab.get_attribute('class')})")
+                    logger.debug("  - '%s' (class: %s)", tab.text, tab.get_attribute('class'))
             except Exception as e:
-                print(f"⚠️ Could not debug timeline tabs: {e}")
+                logger.warning("⚠️ Could not debug timeline tabs: %s", e)
             
             for tab_name, column_name in history_tabs.items():
                 try:
-                    # Try to click on the specific tab using multiple selector strategies
-                    # Based on the HTML: <div role="presentation" class="property-timeline__timeline--tab">All</div>
-                    tab_element = None
-                    
-                    # Try multiple selectors for the tab
-                    tab_selectors = [
-                        f"//div[@role='presentation' and contains(@class, 'property-timeline__timeline--tab') and contains(text(), '{tab_name}')]",
-                        f"//div[contains(@class, 'property-timeline__timeline--tab') and contains(text(), '{tab_name}')]",
-                        f"//div[@role='presentation' and text()='{tab_name}']",
-                        f"//div[contains(@class, 'timeline--tab') and contains(text(), '{tab_name}')]"
-                    ]
-                    
-                    for selector in tab_selectors:
-                        try:
-                            tab_element = driver.find_element(By.XPATH, selector)
-                            if tab_element and tab_element.is_displayed():
-                                print(f"✅ Found {tab_name} tab with selector: {selector}")
-                                break
-                        except NoSuchElementException:
-                            continue
-                    
-                    if not tab_element:
-                        print(f"❌ Could not find {tab_name} tab with any selector")
+                    # One XPath union query for every tab markup variant; misses return [] instead of raising
+                    tab_element = find_history_tab(driver, tab_name)
+                    if tab_element is None:
+                        logger.error("❌ Could not find %s tab with any selector", tab_name)
                         continue
                     
                     # Click the tab if it's enabled
                     if tab_element.is_enabled():
-                        driver.execute_script("arguments[0].click();", tab_element)
-                        time.sleep(2)  # Wait for content to load
+                        # Wait for the previous tab's timeline to be replaced by this tab's items or "no history" message
+                        previous_content = driver.find_elements(By.CSS_SELECTOR, TIMELINE_CONTENT_SEL)
+                        clicked = driver.execute_script(_CLICK_UNLESS_ACTIVE_JS, tab_element)
+                        try:
+                            WebDriverWait(driver, TAB_CONTENT_TIMEOUT, poll_frequency=WAIT_POLL_FREQUENCY).until(
+                                timeline_ready(previous_content[0] if clicked and previous_content else None)
+                            )
+                        except TimeoutException:
+                            logger.warning("⚠️ %s timeline not rendered after %s seconds, continuing anyway...", tab_name, TAB_CONTENT_TIMEOUT)
                         
                         # Extract history items from this tab
                         history_items = []
                         
-                        # Try multiple selectors for timeline content
-                        timeline_selectors = [
-                            '.property-timeline__timeline--tab-content ul li',
-                            '.property-timeline__timeline--tab-content li',
-                            '.timeline--tab-content ul li',
-                            '.timeline--tab-content li',
-                            '[data-testid="timeline-item"]',
-                            '.timeline-item'
-                        ]
-                        
-                        timeline_items = []
-                        for selector in timeline_selectors:
-                            try:
-                                timeline_items = driver.find_elements(By.CSS_SELECTOR, selector)
-                                if timeline_items:
-                                    print(f"✅ Found {len(timeline_items)} timeline items with selector: {selector}")
-                                    break
-                            except Exception as e:
-                                continue
-                        
-                        if not timeline_items:
-                            print(f"⚠️ No timeline items found for {tab_name} tab")
+                        # Read all timeline items in one round-trip
+                        timeline_rows = read_timeline_rows(driver)
+                        if timeline_rows:
+                            logger.info("✅ Found %d timeline items", len(timeline_rows))
+                        else:
+                            logger.warning("⚠️ No timeline items found for %s tab", tab_name)
                             # Check if there's a "no history" message
                             try:
-                                no_history = driver.find_element(By.CSS_SELECTOR, '.no-history')
+                                no_history = driver.find_element(By.CSS_SELECTOR, TIMELINE_EMPTY_SEL)
                                 if no_history and no_history.is_displayed():
-                                    print(f"ℹ️ {tab_name} tab shows: {no_history.text}")
+                                    logger.info("ℹ️ %s tab shows: %s", tab_name, no_history.text)
                             except NoSuchElementException:
                                 pass
                         
-                        for item in timeline_items:
-                            try:
-                                # Try multiple selectors for date
-                                date_text = ""
-                                date_selectors = [
-                                    '.date-circle .circle',
-                                    '.date-circle',
-                                    '.timeline-date',
-                                    '.date',
-                                    '[data-testid="timeline-date"]'
-                                ]
-                                
-                                for date_selector in date_selectors:
-                                    try:
-                                        date_elem = item.find_element(By.CSS_SELECTOR, date_selector)
-                                        date_text = date_elem.text.strip()
-                                        if date_text:
-                                            break
-                                    except NoSuchElementException:
-                                        continue
-                                
-                                # Try multiple selectors for description
-                                desc_text = ""
-                                desc_selectors = [
-                                    '.prop-info .heading',
-                                    '.prop-info .title',
-                                    '.timeline-title',
-                                    '.heading',
-                                    '.title',
-                                    '[data-testid="timeline-title"]'
-                                ]
-                                
-                                for desc_selector in desc_selectors:
-                                    try:
-                                        desc_elem = item.find_element(By.CSS_SELECTOR, desc_selector)
-                                        desc_text = desc_elem.text.strip()
-                                        if desc_text:
-                                            break
-                                    except NoSuchElementException:
-                                        continue
-                                
-                                # Try multiple selectors for details
-                                details = []
-                                detail_selectors = [
-                                    '.prop-info .details',
-                                    '.timeline-details',
-                                    '.details',
-                                    '.info'
-                                ]
-                                
-                                for detail_selector in detail_selectors:
-                                    try:
-                                        detail_elems = item.find_elements(By.CSS_SELECTOR, detail_selector)
-                                        for detail in detail_elems:
-                                            detail_text = detail.text.strip()
-                                            if detail_text:
-                                                details.append(detail_text)
-                                        if details:
-                                            break
-                                    except NoSuchElementException:
-                                        continue
-                                
-                                # Create history item if we have at least date or description
-                                if date_text or desc_text:
-                                    history_item = f"{date_text}: {desc_text}" if date_text and desc_text else (date_text or desc_text)
-                                    if details:
-                                        history_item += f" ({'; '.join(details)})"
-                                    history_items.append(history_item)
-                                else:
-                                    # Fallback: get all text from the item
-                                    item_text = item.text.strip()
-                                    if item_text:
-                                        history_items.append(item_text)
-                                        
-                            except Exception as e:
-                                print(f"⚠️ Error extracting timeline item: {e}")
-                                continue
+                        for row in timeline_rows:
+                            date_text = row.get('date') or ''
+                            desc_text = row.get('description') or ''
+                            details = row.get('details') or []
+                            
+                            # Create history item if we have at least date or description
+                            if date_text or desc_text:
+                                history_item = f"{date_text}: {desc_text}" if date_text and desc_text else (date_text or desc_text)
+                                if details:
+                                    history_item += f" ({'; '.join(details)})"
+                                history_items.append(history_item)
+                            elif row.get('text'):
+                                # Fallback: get all text from the item
+                                history_items.append(row['text'])
                         
                         # Use JSON extraction for property history
-                        history_json = extract_property_history_json(driver, tab_name)
+                        history_json = extract_property_history_json(driver, tab_name, timeline_rows)
                         property_data[column_name] = history_json if history_json != "{}" else ' | '.join(history_items)
-                        print(f"  ✅ {tab_name} history extracted as JSON: {len(history_items)} items")
+                        logger.info("  ✅ %s history extracted as JSON: %d items", tab_name, len(history_items))
                     else:
                         property_data[column_name] = 'Tab not available'
-                        print(f"  ⚠️ {tab_name} tab not available")
+                        logger.warning("  ⚠️ %s tab not available", tab_name)
                 except Exception as e:
                     property_data[column_name] = 'Not available'
-                    print(f"  ❌ {tab_name} history extraction failed: {e}")
+                    logger.error("  ❌ %s history extraction failed: %s", tab_name, e)
         except Exception as e:
-            print(f"  ❌ Property history extraction failed: {e}")
+            logger.error("  ❌ Property history extraction failed: %s", e)
         
         # Extract Natural Risks as JSON
         try:
@@ -1199,72 +1383,53 @@ def extract_property_data(driver, url):
             }
             
             # Try to get error message first
-            error_message = safe_get_text(driver, By.CSS_SELECTOR, '[data-testid="natural-risks-panel"] .error-fetching span')
+            error_message = _text_if_present(driver, '[data-testid="natural-risks-panel"] .error-fetching span')
             if error_message:
                 natural_risks_data["summary"] = error_message
                 natural_risks_data["error"] = True
             else:
-                # Try to get structured risk information using the correct selectors from the HTML
-                # Based on the HTML structure: .MuiGrid-container .MuiGrid-direction-xs-column
-                risk_containers = driver.find_elements(By.CSS_SELECTOR, '[data-testid="natural-risks-panel"] .MuiGrid-container .MuiGrid-direction-xs-column')
+                # Read every risk container's type (.MuiTypography-body1, e.g. Flood Zone) and
+                # status (.MuiTypography-body2, e.g. Not detected) in one call
+                risk_rows = driver.execute_script(NATURAL_RISK_ROWS_JS) or []
                 
-                print(f"  🔍 Found {len(risk_containers)} risk containers")
+                logger.debug("  🔍 Found %d risk containers", len(risk_rows))
                 
-                for container in risk_containers:
-                    try:
-                        # Get the risk type (Flood Zone, Bushfire Zone) using .MuiTypography-body1
-                        risk_type_elem = container.find_element(By.CSS_SELECTOR, '.MuiTypography-body1')
-                        risk_type = risk_type_elem.text.strip()
-                        
-                        # Get the status (Not detected, Detected) using .MuiTypography-body2
-                        status_elem = container.find_element(By.CSS_SELECTOR, '.MuiTypography-body2')
-                        status = status_elem.text.strip()
-                        
-                        print(f"  🔍 Found risk: {risk_type} = {status}")
-                        
-                        # Filter out generic text and include all valid risk types
-                        if risk_type and risk_type not in ["Natural Risks", "View on map", ""]:
+                for risk_type, status in risk_rows:
+                    # Risk types and statuses come from a handful of values ("Flood Zone", "Not detected", ...), so
+                    # share one string object per value across properties
+                    risk_type, status = sys.intern(risk_type), sys.intern(status)
+                    logger.debug("  🔍 Found risk: %s = %s", risk_type, status)
+                    
+                    # Filter out generic text and include all valid risk types
+                    if risk_type and risk_type not in ["Natural Risks", "View on map", ""]:
                         natural_risks_data["risks"].append({
-                                "type": risk_type,
+                            "type": risk_type,
                             "status": status,
-                                "description": f"{risk_type}: {status}"
-                            })
-                    except Exception as container_error:
-                        print(f"  ⚠️ Error extracting risk container: {container_error}")
-                        continue
+                            "description": f"{risk_type}: {status}"
+                        })
                 
                 # If no risks found with the main selector, try alternative selectors
                 if not natural_risks_data["risks"]:
-                    print(f"  🔍 Trying alternative selectors for natural risks...")
+                    logger.debug("  🔍 Trying alternative selectors for natural risks...")
                     
                     # Try to find any risk-related text in the panel
                     try:
                         panel_text = safe_get_text(driver, By.CSS_SELECTOR, '[data-testid="natural-risks-panel"]')
-                        print(f"  🔍 Panel text: {panel_text[:200]}...")
-                        
-                        # Look for patterns like "Flood Zone: Not detected"
-                        import re
-                        risk_patterns = [
-                            r'(Flood Zone)[:\s]*([^,\n]+)',
-                            r'(Bushfire Zone)[:\s]*([^,\n]+)',
-                            r'(Fire Zone)[:\s]*([^,\n]+)',
-                            r'(Storm Zone)[:\s]*([^,\n]+)'
-                        ]
+                        logger.debug("  🔍 Panel text: %s...", panel_text[:200])
                         
-                        for pattern in risk_patterns:
-                            matches = re.findall(pattern, panel_text, re.IGNORECASE)
-                            for match in matches:
-                                risk_type = match[0].strip()
-                                status = match[1].strip()
-                                if risk_type and status:
-                                    natural_risks_data["risks"].append({
-                                        "type": risk_type,
-                                        "status": status,
-                                        "description": f"{risk_type}: {status}"
-                                    })
-                                    print(f"  🔍 Pattern match: {risk_type} = {status}")
+                        # Look for patterns like "Flood Zone: Not detected", all zones in one pass
+                        for match in _RISK_RE.findall(panel_text):
+                            risk_type = sys.intern(match[0].strip())
+                            status = sys.intern(match[1].strip())
+                            if risk_type and status:
+                                natural_risks_data["risks"].append({
+                                    "type": risk_type,
+                                    "status": status,
+                                    "description": f"{risk_type}: {status}"
+                                })
+                                logger.debug("  🔍 Pattern match: %s = %s", risk_type, status)
                     except Exception as pattern_error:
-                        print(f"  ⚠️ Pattern matching failed: {pattern_error}")
+                        logger.warning("  ⚠️ Pattern matching failed: %s", pattern_error)
                 
                 if natural_risks_data["risks"]:
                     natural_risks_data["summary"] = f"Found {len(natural_risks_data['risks'])} risk(s): " + ", ".join([f"{r['type']} ({r['status']})" for r in natural_risks_data["risks"]])
@@ -1275,10 +1440,10 @@ def extract_property_data(driver, url):
             
             # Store both JSON and plain text versions
             property_data['Natural_Risks'] = natural_risks_data["summary"]
-            property_data['Natural_Risks_JSON'] = json.dumps(natural_risks_data)
-            print(f"  ✅ Natural risks extracted: {natural_risks_data['summary']}")
+            property_data['Natural_Risks_JSON'] = _dumps(natural_risks_data)
+            logger.info("  ✅ Natural risks extracted: %s", natural_risks_data['summary'])
         except Exception as e:
-            print(f"  ❌ Natural risks extraction failed: {e}")
+            logger.error("  ❌ Natural risks extraction failed: %s", e)
             property_data['Natural_Risks'] = 'Not available'
             property_data['Natural_Risks_JSON'] = '{}'
         
@@ -1289,124 +1454,50 @@ def extract_property_data(driver, url):
                 'Rental Estimate': 'Valuation_Estimate_Rental'
             }
             
+            # Resolve every tab menu once; a missing tab is reported as not available
+            tab_menus = find_tab_menus(driver)
+            
+            previous_panel = None
             for tab_name, column_name in valuation_tabs.items():
                 try:
-                    # Try to click on the specific tab
-                    tab_element = driver.find_element(By.CSS_SELECTOR, f'[data-testid="crux-tab-menu-{tab_name}"]')
-                    if tab_element and tab_element.is_enabled():
-                        driver.execute_script("arguments[0].click();", tab_element)
-                        time.sleep(2)  # Wait for content to load
+                    tab_element = tab_menus.get(tab_name)
+                    if tab_element is not None and tab_element.is_enabled():
+                        # Also the avm-detail text used as the fallback below
+                        previous_panel = switch_tab_panel(driver, tab_element, AVM_PANEL_SEL, AVM_READY_SEL, previous_panel)
                         
-                        # Check for error message first
-                        error_content = safe_get_text(driver, By.CSS_SELECTOR, '[data-testid="avm-detail"] .error-fetching span')
-                        if error_content:
-                            property_data[column_name] = error_content
+                        # Read the error message, confidence, yield and range figures from the panel in one call
+                        panel = read_avm_panel(driver)
+                        if panel.get('error'):
+                            property_data[column_name] = panel['error']
                         else:
-                            # Extract structured valuation data
-                            valuation_data = {}
-                            
-                            # Extract confidence level
-                            confidence = safe_get_text(driver, By.CSS_SELECTOR, '[data-testid="avm-detail"] .confidence')
-                            if confidence:
-                                valuation_data['confidence'] = confidence
-                            
-                            # Extract valuation range data
-                            if tab_name == 'Valuation Estimate':
-                                # Extract Low, Estimate, High values
-                                low_value = safe_get_text(driver, By.CSS_SELECTOR, '[data-testid="avm-range"] .valuation-range-footer .flex-grow:first-child .author')
-                                estimate_value = safe_get_text(driver, By.CSS_SELECTOR, '[data-testid="avm-range"] .valuation-range-footer .flex-grow:nth-child(2) .legend .author')
-                                high_value = safe_get_text(driver, By.CSS_SELECTOR, '[data-testid="avm-range"] .valuation-range-footer .flex-grow:last-child .author')
-                                
-                                if low_value or estimate_value or high_value:
-                                    valuation_data['low_value'] = low_value
-                                    valuation_data['estimate_value'] = estimate_value
-                                    valuation_data['high_value'] = high_value
-                                    
-                                    # Create a readable summary
-                                    summary_parts = []
-                                    if low_value:
-                                        summary_parts.append(f"Low: {low_value}")
-                                    if estimate_value:
-                                        summary_parts.append(f"Estimate: {estimate_value}")
-                                    if high_value:
-                                        summary_parts.append(f"High: {high_value}")
-                                    
-                                    if confidence:
-                                        summary_parts.append(f"Confidence: {confidence}")
-                                    
-                                    property_data[column_name] = " | ".join(summary_parts)
-                                else:
-                                    # Fallback to general content extraction
-                                    content = safe_get_text(driver, By.CSS_SELECTOR, '[data-testid="avm-detail"]')
-                            property_data[column_name] = content if content else 'Not available'
-                            
+                            # Derive both the summary and the JSON from the same figures
+                            avm_data = {key: panel.get(key, '') for key in ('confidence', *AVM_RANGE_SELECTORS)}
                             if tab_name == 'Rental Estimate':
-                                # For Rental Estimate, extract structured rental data
-                                rental_data = {}
-                                
-                                # Extract confidence level
-                                confidence = safe_get_text(driver, By.CSS_SELECTOR, '[data-testid="avm-detail"] .confidence')
-                                if confidence:
-                                    rental_data['confidence'] = confidence
-                                
-                                # Extract rental yield
-                                yield_elem = driver.find_element(By.CSS_SELECTOR, '#rental-avm-details')
-                                if yield_elem:
-                                    yield_text = yield_elem.text.strip()
-                                    # Extract percentage from text like "Estimated Rental Yield 1.8%"
-                                    import re
-                                    yield_match = re.search(r'(\d+\.?\d*%)', yield_text)
-                                    if yield_match:
-                                        rental_data['rental_yield'] = yield_match.group(1)
-                                
-                                # Extract rental range values
-                                low_value = safe_get_text(driver, By.CSS_SELECTOR, '[data-testid="avm-range"] .valuation-range-footer .flex-grow:first-child .author')
-                                estimate_value = safe_get_text(driver, By.CSS_SELECTOR, '[data-testid="avm-range"] .valuation-range-footer .flex-grow:nth-child(2) .legend .author')
-                                high_value = safe_get_text(driver, By.CSS_SELECTOR, '[data-testid="avm-range"] .valuation-range-footer .flex-grow:last-child .author')
-                                
-                                if low_value or estimate_value or high_value:
-                                    rental_data['low_value'] = low_value
-                                    rental_data['estimate_value'] = estimate_value
-                                    rental_data['high_value'] = high_value
-                                    
-                                    # Create a readable summary
-                                    summary_parts = []
-                                    if low_value:
-                                        summary_parts.append(f"Low: {low_value}")
-                                    if estimate_value:
-                                        summary_parts.append(f"Estimate: {estimate_value}")
-                                    if high_value:
-                                        summary_parts.append(f"High: {high_value}")
-                                    
-                                    if rental_data.get('rental_yield'):
-                                        summary_parts.append(f"Yield: {rental_data['rental_yield']}")
-                                    
-                                    if confidence:
-                                        summary_parts.append(f"Confidence: {confidence}")
-                                    
-                                    property_data[column_name] = " | ".join(summary_parts)
-                                else:
-                                    # Fallback to general content extraction
-                                    content = safe_get_text(driver, By.CSS_SELECTOR, '[data-testid="avm-detail"]')
-                                    property_data[column_name] = content if content else 'Not available'
-                                
-                                # Store structured data as JSON if we have rental data
-                                if rental_data:
-                                    property_data[f'{column_name}_JSON'] = json.dumps(rental_data)
+                                yield_match = _YIELD_RE.search(panel.get('yield_text', ''))
+                                avm_data['rental_yield'] = yield_match.group(0) if yield_match else ''
                             
-                            # Store structured data as JSON if we have valuation data
-                            if valuation_data and tab_name == 'Valuation Estimate':
-                                property_data[f'{column_name}_JSON'] = json.dumps(valuation_data)
+                            if avm_data['low_value'] or avm_data['estimate_value'] or avm_data['high_value']:
+                                property_data[column_name] = " | ".join(
+                                    f"{label}: {avm_data[key]}" for label, key in AVM_SUMMARY_FIELDS if avm_data.get(key)
+                                )
+                            else:
+                                # Fallback to the panel's full text, already read while waiting for the tab
+                                property_data[column_name] = previous_panel if previous_panel else 'Not available'
+                            
+                            # Store the structured figures found as JSON
+                            avm_data = {key: value for key, value in avm_data.items() if value}
+                            if avm_data:
+                                property_data[f'{column_name}_JSON'] = _dumps(avm_data)
                         
-                        print(f"  ✅ {tab_name} extracted: {len(property_data[column_name]) if property_data[column_name] else 0} characters")
+                        logger.info("  ✅ %s extracted: %s characters", tab_name, len(property_data[column_name]) if property_data[column_name] else 0)
                     else:
                         property_data[column_name] = 'Tab not available'
-                        print(f"  ⚠️ {tab_name} tab not available")
+                        logger.warning("  ⚠️ %s tab not available", tab_name)
                 except Exception as e:
                     property_data[column_name] = 'Not available'
-                    print(f"  ❌ {tab_name} extraction failed: {e}")
+                    logger.error("  ❌ %s extraction failed: %s", tab_name, e)
         except Exception as e:
-            print(f"  ❌ Valuation estimate extraction failed: {e}")
+            logger.error("  ❌ Valuation estimate extraction failed: %s", e)
         
         # Extract Nearby Schools - separate tabs (In Catchment, All Nearby)
         try:
@@ -1415,172 +1506,307 @@ def extract_property_data(driver, url):
                 'All Nearby': 'Nearby_Schools_All_Nearby'
             }
             
+            # Resolve every tab menu once; a missing tab is reported as not available
+            tab_menus = find_tab_menus(driver)
+            
+            previous_panel = None
             for tab_name, column_name in schools_tabs.items():
                 try:
-                    # Try to click on the specific tab
-                    tab_element = driver.find_element(By.CSS_SELECTOR, f'[data-testid="crux-tab-menu-{tab_name}"]')
-                    if tab_element and tab_element.is_enabled():
-                        driver.execute_script("arguments[0].click();", tab_element)
-                        time.sleep(3)  # Wait for content to load
+                    tab_element = tab_menus.get(tab_name)
+                    if tab_element is not None and tab_element.is_enabled():
+                        previous_panel = switch_tab_panel(driver, tab_element, SCHOOL_PANEL_SEL, SCHOOL_READY_SEL, previous_panel)
                         
                         # Check for error message first
-                        error_content = safe_get_text(driver, By.CSS_SELECTOR, '[data-testid="nearby-school-panel"] .error-fetching span')
+                        error_content = _text_if_present(driver, '[data-testid="nearby-school-panel"] .error-fetching span')
                         if error_content:
                             property_data[column_name] = error_content
                         else:
                             # Extract structured school data
-                            schools_data = []
-                            
-                            # Handle scrollable content - scroll through the school list to load all schools
-                            try:
-                                scroll_container = driver.find_element(By.CSS_SELECTOR, '[data-testid="nearby-school-panel"] .simplebar-content')
-                                
-                                # Scroll to load all schools
-                                last_height = 0
-                                scroll_attempts = 0
-                                max_scroll_attempts = 5
-                                
-                                while scroll_attempts < max_scroll_attempts:
-                                    # Scroll down
-                                    driver.execute_script("arguments[0].scrollTop = arguments[0].scrollHeight", scroll_container)
-                                    time.sleep(1)
-                                    
-                                    # Check if we've reached the bottom
-                                    current_height = driver.execute_script("return arguments[0].scrollHeight", scroll_container)
-                                    if current_height == last_height:
-                                        break
-                                    
-                                    last_height = current_height
-                                    scroll_attempts += 1
-                                
-                                print(f"  📜 Scrolled through school list ({scroll_attempts} attempts)")
-                            except Exception as scroll_error:
-                                print(f"  ⚠️ Could not scroll school list: {scroll_error}")
-                            
-                            # Get all school list items after scrolling
-                            school_items = driver.find_elements(By.CSS_SELECTOR, '[data-testid="nearby-school-panel"] ul.nearby-school-list-container li[data-testid="list-template"]')
-                            
-                            for school_item in school_items:
-                                try:
-                                    school_info = {}
-                                    
-                                    # Extract school name
-                                    name_elem = school_item.find_element(By.CSS_SELECTOR, '.school-name')
-                                    school_info['name'] = name_elem.text.strip()
-                                    
-                                    # Extract address
-                                    address_elem = school_item.find_element(By.CSS_SELECTOR, '.place-address')
-                                    school_info['address'] = address_elem.text.strip()
-                                    
-                                    # Extract distance
-                                    distance_elem = school_item.find_element(By.CSS_SELECTOR, '.school-distance')
-                                    school_info['distance'] = distance_elem.text.strip()
-                                    
-                                    # Extract school attributes (chips)
-                                    attributes = {}
-                                    
-                                    # School Type
-                                    try:
-                                        type_elem = school_item.find_element(By.CSS_SELECTOR, '[data-testid="schoolType"] .MuiChip-label')
-                                        attributes['type'] = type_elem.text.strip()
-                                    except:
-                                        attributes['type'] = ''
-                                    
-                                    # School Sector
-                                    try:
-                                        sector_elem = school_item.find_element(By.CSS_SELECTOR, '[data-testid="schoolSector"] .MuiChip-label')
-                                        attributes['sector'] = sector_elem.text.strip()
-                                    except:
-                                        attributes['sector'] = ''
-                                    
-                                    # School Gender
-                                    try:
-                                        gender_elem = school_item.find_element(By.CSS_SELECTOR, '[data-testid="schoolGender"] .MuiChip-label')
-                                        attributes['gender'] = gender_elem.text.strip()
-                                    except:
-                                        attributes['gender'] = ''
-                                    
-                                    # School Year Levels
-                                    try:
-                                        year_elem = school_item.find_element(By.CSS_SELECTOR, '[data-testid="schoolYear"] .MuiChip-label')
-                                        attributes['year_levels'] = year_elem.text.strip()
-                                    except:
-                                        attributes['year_levels'] = ''
-                                    
-                                    # School Enrollments
-                                    try:
-                                        enroll_elem = school_item.find_element(By.CSS_SELECTOR, '[data-testid="schoolEnrolments"] .MuiChip-label')
-                                        attributes['enrollments'] = enroll_elem.text.strip()
-                                    except:
-                                        attributes['enrollments'] = ''
-                                    
-                                    school_info['attributes'] = attributes
-                                    schools_data.append(school_info)
-                                    
-                                except Exception as school_error:
-                                    print(f"  ⚠️ Error extracting individual school: {school_error}")
-                                    continue
+                            # Scroll through the school list to load all schools, then read every school's fields and
+                            # attribute chips, all in one browser call
+                            school_scan = driver.execute_async_script(
+                                SCHOOLS_SCROLL_AND_COLLECT_JS, SCHOOL_SCROLL_INTERVAL_MS, SCHOOL_SCROLL_MAX_CHECKS,
+                                _SCHOOL_FIELDS, _SCHOOL_ATTRIBUTE_FIELDS
+                            ) or {}
+                            if school_scan.get('scrolled'):
+                                logger.info("  📜 Scrolled through school list (%s checks)", school_scan.get('checks'))
+                            else:
+                                logger.warning("  ⚠️ Could not scroll school list: scroll container not found")
+                            schools_data = school_scan.get('schools') or []
+                            # Attribute chips repeat across schools and properties ("Government", "Co-Educational", ...)
+                            for school in schools_data:
+                                school['attributes'] = {key: sys.intern(value) for key, value in school['attributes'].items()}
                             
                             # Store as JSON
                             if schools_data:
-                                property_data[column_name] = json.dumps(schools_data)
-                                print(f"  ✅ {tab_name} extracted: {len(schools_data)} schools")
+                                property_data[column_name] = _dumps(schools_data)
+                                logger.info("  ✅ %s extracted: %d schools", tab_name, len(schools_data))
                             else:
                                 property_data[column_name] = 'No schools found'
-                                print(f"  ℹ️ {tab_name}: No schools found")
+                                logger.info("  ℹ️ %s: No schools found", tab_name)
                         
                     else:
                         property_data[column_name] = 'Tab not available'
-                        print(f"  ⚠️ {tab_name} tab not available")
+                        logger.warning("  ⚠️ %s tab not available", tab_name)
                 except Exception as e:
                     property_data[column_name] = 'Not available'
-                    print(f"  ❌ {tab_name} extraction failed: {e}")
+                    logger.error("  ❌ %s extraction failed: %s", tab_name, e)
         except Exception as e:
-            print(f"  ❌ Nearby schools extraction failed: {e}")
-        
+            logger.error("  ❌ Nearby schools extraction failed: %s", e)
         
-        # Debug: Print extracted data
-        print(f"📊 Extracted data:")
-        print(f"  Address: {property_data['Address']}")
-        print(f"  Property Type: {property_data['Property_Type']}")
-        print(f"  Land Size: {property_data['Land_Size']}")
-        print(f"  Last Sold Price: {property_data['Last_Sold_Price']}")
-        print(f"  Last Sold Date: {property_data['Last_Sold_Date']}")
-        print(f"  Sold By: {property_data['Sold_By']}")
-        print(f"  Advertisement Date: {property_data['Advertisement_Date']}")
-        print(f"  Listing Description: {property_data['Listing_Description'][:100]}..." if property_data['Listing_Description'] else "  Listing Description: None")
-        print(f"  Advertising Agent Info: {property_data['Advertising_Agent_Info_JSON'][:100]}..." if property_data['Advertising_Agent_Info_JSON'] else "  Advertising Agent Info: None")
-        print(f"  Property History All: {property_data['Property_History_All'][:100]}..." if property_data['Property_History_All'] else "  Property History All: None")
-        print(f"  Property History Sale: {property_data['Property_History_Sale'][:100]}..." if property_data['Property_History_Sale'] else "  Property History Sale: None")
-        print(f"  Natural Risks: {property_data['Natural_Risks']}")
-        print(f"  Valuation Estimate: {property_data['Valuation_Estimate_Estimate'][:100]}..." if property_data['Valuation_Estimate_Estimate'] else "  Valuation Estimate: None")
-        print(f"  Valuation Estimate JSON: {property_data['Valuation_Estimate_Estimate_JSON'][:100]}..." if property_data['Valuation_Estimate_Estimate_JSON'] else "  Valuation Estimate JSON: None")
-        print(f"  Rental Estimate: {property_data['Valuation_Estimate_Rental'][:100]}..." if property_data['Valuation_Estimate_Rental'] else "  Rental Estimate: None")
-        print(f"  Rental Estimate JSON: {property_data['Valuation_Estimate_Rental_JSON'][:100]}..." if property_data['Valuation_Estimate_Rental_JSON'] else "  Rental Estimate JSON: None")
-        print(f"  Schools In Catchment: {property_data['Nearby_Schools_In_Catchment'][:100]}..." if property_data['Nearby_Schools_In_Catchment'] else "  Schools In Catchment: None")
-        print(f"  Schools All Nearby: {property_data['Nearby_Schools_All_Nearby'][:100]}..." if property_data['Nearby_Schools_All_Nearby'] else "  Schools All Nearby: None")
-        print(f"  Legal Description: {property_data['Additional_Information_Legal_Description'][:100]}..." if property_data['Additional_Information_Legal_Description'] else "  Legal Description: None")
-        print(f"  Property Features: {property_data['Additional_Information_Property_Features'][:100]}..." if property_data['Additional_Information_Property_Features'] else "  Property Features: None")
-        print(f"  Land Values: {property_data['Additional_Information_Land_Values'][:100]}..." if property_data['Additional_Information_Land_Values'] else "  Land Values: None")
-        print(f"  Owner Information: {property_data['Household_Information_Owner_Information'][:100]}..." if property_data['Household_Information_Owner_Information'] else "  Owner Information: None")
-        print(f"  Marketing Contacts: {property_data['Household_Information_Marketing_Contacts'][:100]}..." if property_data['Household_Information_Marketing_Contacts'] else "  Marketing Contacts: None")
         
-        # Print JSON structured data
-        print(f"📋 JSON Structured Data:")
-        print(f"  Property Attributes JSON: {property_data['Property_Attributes_JSON']}")
-        print(f"  Sale Information JSON: {property_data['Sale_Information_JSON']}")
-        print(f"  Advertising Agent Info JSON: {property_data['Advertising_Agent_Info_JSON']}")
-        print(f"  Natural Risks JSON: {property_data['Natural_Risks_JSON']}")
-        print(f"  Valuation Estimate JSON: {property_data['Valuation_Estimate_Estimate_JSON']}")
-        print(f"  Rental Estimate JSON: {property_data['Valuation_Estimate_Rental_JSON']}")
+        # Debug: log extracted data; skipped entirely (no slicing or formatting) unless DEBUG is enabled
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("📊 Extracted data:")
+            for label, column, truncate in _DEBUG_SUMMARY_FIELDS:
+                value = property_data[column]
+                if truncate:
+                    value = value[:100] + "..." if value else None
+                logger.debug("  %s: %s", label, value)
+            
+            logger.debug("📋 JSON Structured Data:")
+            for label, column in _DEBUG_JSON_FIELDS:
+                logger.debug("  %s: %s", label, property_data[column])
         
-        print(f"✅ Successfully scraped property data")
+        logger.info("✅ Successfully scraped property data")
         return property_data
         
     except Exception as e:
-        print(f"❌ Error scraping property {url}: {e}")
+        logger.error("❌ Error scraping property %s: %s", url, e)
+        return None
+
+def create_driver(headless=HEADLESS):
+    """Start a Chrome driver configured for scraping; reuse it across URLs rather than starting one per page."""
+    driver = webdriver.Chrome(options=build_chrome_options(headless))
+    driver.set_page_load_timeout(600)
+    driver.set_script_timeout(600)
+    block_heavy_resources(driver)
+    return driver
+
+def login(driver, page_load_wait=3, login_wait=20):
+    """Log in to CoreLogic unless the session is already signed in; raise RuntimeError if login does not complete."""
+    if not CORELOGIC_USERNAME or not CORELOGIC_PASSWORD:
+        raise RuntimeError("Set CORELOGIC_USERNAME and CORELOGIC_PASSWORD in the environment before scraping")
+    logger.info("🔐 Starting login process...")
+    driver.get("https://rpp.corelogic.com.au/")
+    logger.info("✅ Login page loaded")
+    
+    # Wait for either the sign-on form or the signed-in app, whichever the session lands on
+    try:
+        WebDriverWait(driver, page_load_wait, poll_frequency=WAIT_POLL_FREQUENCY).until(EC.any_of(
+            EC.presence_of_element_located((By.ID, "username")),
+            EC.presence_of_element_located((By.CSS_SELECTOR, LOGGED_IN_SELECTOR)),
+        ))
+    except TimeoutException:
+        pass
+    logger.info("Current URL after login page load: %s", driver.current_url)
+    
+    if driver.find_elements(By.CSS_SELECTOR, LOGGED_IN_SELECTOR):
+        logger.info("✅ Already logged in")
+        return
+    
+    logger.info("🔐 Proceeding with login...")
+    
+    username_field = WebDriverWait(driver, 10, poll_frequency=WAIT_POLL_FREQUENCY, ignored_exceptions=WAIT_IGNORED_EXCEPTIONS).until(
+        EC.presence_of_element_located((By.ID, "username"))
+    )
+    username_field.clear()
+    username_field.send_keys(CORELOGIC_USERNAME)
+    logger.info("✅ Username entered")
+    
+    password_field = WebDriverWait(driver, 10, poll_frequency=WAIT_POLL_FREQUENCY, ignored_exceptions=WAIT_IGNORED_EXCEPTIONS).until(
+        EC.presence_of_element_located((By.ID, "password"))
+    )
+    password_field.clear()
+    password_field.send_keys(CORELOGIC_PASSWORD)
+    logger.info("✅ Password entered")
+    
+    sign_on_button = WebDriverWait(driver, 10, poll_frequency=WAIT_POLL_FREQUENCY, ignored_exceptions=WAIT_IGNORED_EXCEPTIONS).until(
+        EC.element_to_be_clickable((By.ID, "signOnButton"))
+    )
+    sign_on_button.click()
+    logger.info("✅ Login button clicked")
+    
+    # Login is complete only once the signed-in app renders; an error page or interstitial never shows it
+    try:
+        WebDriverWait(driver, login_wait, poll_frequency=WAIT_POLL_FREQUENCY).until(
+            EC.presence_of_element_located((By.CSS_SELECTOR, LOGGED_IN_SELECTOR))
+        )
+    except TimeoutException:
+        raise RuntimeError(
+            f"Login did not complete within {login_wait} seconds (still at {driver.current_url})"
+        ) from None
+    logger.info("✅ Logged in: %s", driver.current_url)
+
+def build_driver(headless=HEADLESS):
+    """Start a scraping driver and log it in, so a worker pays for login once and reuses the session."""
+    driver = create_driver(headless)
+    try:
+        login(driver)
+    except Exception:
+        driver.quit()
+        raise
+    return driver
+
+def _scrape_with_pooled_driver(driver_pool, url, position, total):
+    """Borrow a driver from driver_pool, scrape one URL with it and hand it back."""
+    driver = driver_pool.get()
+    try:
+        logger.info("📊 Processing property %s/%d", position, total)
+        return extract_property_data(driver, url)
+    finally:
+        # Add delay between requests to be respectful
+        time.sleep(2)
+        driver_pool.put(driver)
+
+def read_scraped_urls(output_csv=ROWS_CSV_PATH):
+    """Return the Property_URL values already in output_csv, or None when it is missing.
+    
+    Raises ValueError when output_csv has other columns, so resuming never overwrites rows it cannot append to.
+    """
+    try:
+        with open(output_csv, newline='', encoding='utf-8') as csv_file:
+            reader = csv.DictReader(csv_file)
+            if reader.fieldnames != list(_ROW_TEMPLATE):
+                raise ValueError(f"Cannot resume: {output_csv} has different columns; move it aside or unset SCRAPER_RESUME")
+            return {row['Property_URL'] for row in reader}
+    except FileNotFoundError:
         return None
 
+def write_queued_rows(row_queue, csv_file, writer):
+    """Write rows taken from row_queue with writer, flushing csv_file after each, until None arrives; return the count."""
+    rows_written = 0
+    try:
+        for property_data in iter(row_queue.get, None):
+            writer.writerow(property_data)
+            csv_file.flush()
+            rows_written += 1
+    except Exception as e:
+        logger.error("❌ Writing rows failed after %d rows: %s", rows_written, e)
+        raise
+    return rows_written
+
+def scrape_into_queue(urls, workers, drivers, row_queue, writer_future):
+    """Scrape urls across workers logged-in drivers and put each extracted row on row_queue as soon as it finishes.
+    
+    Every started driver is appended to drivers, so the caller can quit them even if startup or scraping fails.
+    writer_future is the thread writing row_queue to disk; if it stops early (e.g. disk full), its error is raised
+    here and the URLs not yet started are cancelled instead of scraping rows nothing will write.
+    """
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        # Start and log in every driver at once rather than one after another
+        driver_pool = queue.Queue()
+        driver_futures = [executor.submit(build_driver) for _ in range(workers)]
+        startup_errors = []
+        for driver_future in driver_futures:
+            if driver_future.exception() is None:
+                drivers.append(driver_future.result())
+                driver_pool.put(drivers[-1])
+            else:
+                startup_errors.append(driver_future.exception())
+                logger.error("❌ Driver failed to start or log in: %s", startup_errors[-1])
+        # Carry on with the drivers that did start; only a pool with none at all is fatal
+        if not drivers:
+            raise startup_errors[0]
+        if startup_errors:
+            logger.warning("⚠️ Scraping with %d of %d drivers", len(drivers), workers)
+        
+        # Scrape each property; hand rows over in completion order so a slow page never holds back finished ones
+        scrape_futures = [
+            executor.submit(_scrape_with_pooled_driver, driver_pool, url, position, len(urls))
+            for position, url in enumerate(urls, 1)
+        ]
+        try:
+            for scrape_future in as_completed(scrape_futures):
+                # The writer only returns on the None sentinel, so finishing before it means it failed
+                if writer_future.done():
+                    writer_future.result()
+                    raise RuntimeError("Row writer stopped before all rows were written")
+                property_data = scrape_future.result()
+                if property_data:
+                    row_queue.put(property_data)
+        except BaseException:
+            for scrape_future in scrape_futures:
+                scrape_future.cancel()
+            raise
+
+def scrape_urls(urls, output_csv=ROWS_CSV_PATH, workers=SCRAPER_WORKERS, resume=RESUME_SCRAPE):
+    """Scrape URLs across a pool of logged-in drivers and append every row to output_csv as it is extracted.
+    
+    Each worker thread borrows a driver per URL, so page loads and waits overlap across sessions. Rows are
+    handed to a writer thread as each property finishes and flushed one at a time, so memory stays flat and a crash keeps
+    everything scraped so far. With resume, URLs already in output_csv are skipped and new rows are appended;
+    otherwise the file is rewritten. Returns the number of rows written.
+    """
+    scraped_urls = read_scraped_urls(output_csv) if resume else None
+    if scraped_urls is not None:
+        skipped = len(urls)
+        urls = [url for url in urls if url not in scraped_urls]
+        skipped -= len(urls)
+        logger.warning("⏩ Resuming: skipping %d URLs already in %s (kept as scraped earlier), %d left to scrape",
+                       skipped, output_csv, len(urls))
+    if not urls:
+        return 0
+    
+    workers = max(1, min(workers, len(urls)))
+    drivers = []
+    try:
+        with open(output_csv, 'a' if scraped_urls is not None else 'w', newline='', encoding='utf-8') as csv_file:
+            writer = csv.DictWriter(csv_file, fieldnames=list(_ROW_TEMPLATE), extrasaction='ignore')
+            if scraped_urls is None:
+                writer.writeheader()
+            
+            # A dedicated thread writes and flushes rows, so disk writes never hold up collecting results
+            row_queue = queue.Queue()
+            with ThreadPoolExecutor(max_workers=1) as row_writer:
+                rows_future = row_writer.submit(write_queued_rows, row_queue, csv_file, writer)
+                try:
+                    scrape_into_queue(urls, workers, drivers, row_queue, rows_future)
+                finally:
+                    row_queue.put(None)
+                rows_written = rows_future.result()
+        
+        logger.info("💾 Streamed %s rows to %s", rows_written, output_csv)
+        return rows_written
+    finally:
+        for driver in drivers:
+            driver.quit()
+        logger.info("🔚 Browser closed")
+
+def load_scraped_rows(output_csv=ROWS_CSV_PATH):
+    """Read the rows streamed by scrape_urls back as a list of dicts with string values."""
+    return pd.read_csv(output_csv, dtype=str, keep_default_na=False).to_dict('records')
+
+def save_card_workbook(df_all, filename):
+    """Write one workbook with a sheet per CARD_COLUMNS card plus a Master sheet with every column."""
+    with pd.ExcelWriter(filename, engine='xlsxwriter', engine_kwargs=EXCEL_ENGINE_KWARGS) as writer:
+        for card_name, columns in CARD_COLUMNS.items():
+            df_all.reindex(columns=columns, fill_value='').to_excel(writer, sheet_name=card_name, index=False)
+        # Also save a master sheet with all data for reference
+        df_all.to_excel(writer, sheet_name='Master', index=False)
+    logger.info("✅ Saved %d records to %s", len(df_all), filename)
+
+def save_card_tables(df_all, stem, fmt):
+    """Write each CARD_COLUMNS card and a master table with every column to <stem>_<card>.<fmt> files."""
+    tables = {card_name: df_all.reindex(columns=columns, fill_value='') for card_name, columns in CARD_COLUMNS.items()}
+    tables['Master'] = df_all
+    for table_name, df in tables.items():
+        filename = f'{stem}_{table_name.lower()}.{fmt}'
+        if fmt == 'parquet':
+            df.to_parquet(filename, engine='pyarrow', compression='snappy', index=False)
+        else:
+            df.to_feather(filename)
+        logger.info("✅ Saved %d records to %s", len(df), filename)
+
+def save_cards(df_all, stem, fmt=SAVE_FORMAT):
+    """Save the card tables and master table as fmt: parquet or feather files, or an Excel workbook."""
+    if fmt == 'excel':
+        save_card_workbook(df_all, f'{stem}.xlsx')
+    elif fmt in ('parquet', 'feather'):
+        save_card_tables(df_all, stem, fmt)
+    else:
+        raise ValueError(f"Unknown save format {fmt!r}; use parquet, feather or excel")
+
 def scrape_all_properties():
     """Main function to scrape all properties from vic_links.csv"""
     
@@ -1589,362 +1815,54 @@ def scrape_all_properties():
         # df_links = pd.read_csv('vic_links.csv')
         # urls = df_links['Property_URL'].dropna().tolist()
         urls=['https://rpp.corelogic.com.au/property/47-wellington-parade-south-east-melbourne-vic-3002/17241185']
-        print(f"📋 Found {len(urls)} property URLs to scrape")
+        logger.info("📋 Found %d property URLs to scrape", len(urls))
     except Exception as e:
-        print(f"❌ Error reading vic_links.csv: {e}")
+        logger.error("❌ Error reading vic_links.csv: %s", e)
         return
     
-    # Setup Chrome driver
-    options = Options()
-    options.add_experimental_option("detach", True)
-    driver = webdriver.Chrome(options=options)
-    driver.set_page_load_timeout(600)
-    driver.set_script_timeout(600)
-    
     try:
-        # Login first
-        print("🔐 Starting login process...")
-        driver.get("https://rpp.corelogic.com.au/")
-        print("✅ Login page loaded")
-        
-        # Wait for page to fully load
-        time.sleep(3)
+        # Scrape every property across the driver pool, streaming rows to disk; rows from an earlier
+        # interrupted run are kept and included in the card files only with SCRAPER_RESUME=1, otherwise
+        # the rows CSV is rewritten
+        scrape_urls(urls)
+        all_property_data = load_scraped_rows() if os.path.exists(ROWS_CSV_PATH) else []
         
-        # Check if we're already logged in
-        try:
-            current_url = driver.current_url
-            print(f"Current URL after login page load: {current_url}")
-            
-            # If we're redirected to a different page, we might already be logged in
-            if "login" not in current_url.lower() and "signin" not in current_url.lower():
-                print("✅ Already logged in or redirected to main page")
-            else:
-                print("🔐 Proceeding with login...")
-                
-                username_field = wait_until_present(driver, By.ID, "username", timeout=10)
-                username_field.clear()
-                username_field.send_keys("delpg2021")
-                print("✅ Username entered")
-                
-                password_field = wait_until_present(driver, By.ID, "password", timeout=10)
-                password_field.clear()
-                password_field.send_keys("FlatHead@2024")
-                print("✅ Password entered")
-                
-                sign_on_button = wait_until_clickable(driver, By.ID, "signOnButton", timeout=10)
-                sign_on_button.click()
-                print("✅ Login button clicked")
-                
-                # Wait for login to complete and check for redirect
-                time.sleep(20)
-                current_url = driver.current_url
-                print(f"URL after login attempt: {current_url}")
-                
-        except Exception as login_error:
-            print(f"⚠️ Login error: {login_error}")
-            print("Continuing anyway...")
-        
-        # Final wait to ensure we're ready
-        time.sleep(3)
-        
-        # Scrape each property
-        all_property_data = []
-        for i, url in enumerate(urls, 1):
-            print(f"\n📊 Processing property {i}/{len(urls)}")
-            property_data = extract_property_data(driver, url)
-            if property_data:
-                all_property_data.append(property_data)
-            
-            # Add delay between requests to be respectful
-            time.sleep(2)
-        
-        # Save to separate Excel files for each card type
+        # Save a table for each card type plus the master table
         if all_property_data:
-            print(f"\n💾 Saving data to separate Excel files...")
-            
-            # Create separate data structures for each card
-            property_overview_data = []
-            sale_rental_data = []
-            household_data = []
-            additional_info_data = []
-            natural_risks_data = []
-            schools_data = []
-            valuation_data = []
-            property_history_data = []
-            
-            for prop in all_property_data:
-                # Property Overview Card
-                property_overview_data.append({
-                    'Property_URL': prop.get('Property_URL', ''),
-                    'Address': prop.get('Address', ''),
-                    'Property_Type': prop.get('Property_Type', ''),
-                    'Land_Size': prop.get('Land_Size', ''),
-                    'Floor_Area': prop.get('Floor_Area', ''),
-                    'Bedrooms': prop.get('Bedrooms', ''),
-                    'Bathrooms': prop.get('Bathrooms', ''),
-                    'Car_Spaces': prop.get('Car_Spaces', ''),
-                    'Scraping_Date': prop.get('Scraping_Date', '')
-                })
-                
-                # Sale/Rental Information Card
-                sale_rental_data.append({
-                    'Property_URL': prop.get('Property_URL', ''),
-                    'Address': prop.get('Address', ''),
-                    'Last_Sold_Price': prop.get('Last_Sold_Price', ''),
-                    'Last_Sold_Date': prop.get('Last_Sold_Date', ''),
-                    'Sold_By': prop.get('Sold_By', ''),
-                    'Land_Use': prop.get('Land_Use', ''),
-                    'Issue_Date': prop.get('Issue_Date', ''),
-                    'Advertisement_Date': prop.get('Advertisement_Date', ''),
-                    'Listing_Description': prop.get('Listing_Description', ''),
-                    'Advertising_Agent_Info_JSON': prop.get('Advertising_Agent_Info_JSON', ''),
-                    'Sale_Information_JSON': prop.get('Sale_Information_JSON', ''),
-                    'Scraping_Date': prop.get('Scraping_Date', '')
-                })
-                
-                # Household Information Card
-                household_data.append({
-                    'Property_URL': prop.get('Property_URL', ''),
-                    'Address': prop.get('Address', ''),
-                    'Owner_Type': prop.get('Owner_Type', ''),
-                    'Current_Tenure': prop.get('Current_Tenure', ''),
-                    'Household_Information_Owner_Information': prop.get('Household_Information_Owner_Information', ''),
-                    'Household_Information_Marketing_Contacts': prop.get('Household_Information_Marketing_Contacts', ''),
-                    'Scraping_Date': prop.get('Scraping_Date', '')
-                })
-                
-                # Additional Information Card
-                additional_info_data.append({
-                    'Property_URL': prop.get('Property_URL', ''),
-                    'Address': prop.get('Address', ''),
-                    'Additional_Information_Legal_Description': prop.get('Additional_Information_Legal_Description', ''),
-                    'Additional_Information_Property_Features': prop.get('Additional_Information_Property_Features', ''),
-                    'Additional_Information_Land_Values': prop.get('Additional_Information_Land_Values', ''),
-                    'Scraping_Date': prop.get('Scraping_Date', '')
-                })
-                
-                # Natural Risks Card
-                natural_risks_data.append({
-                    'Property_URL': prop.get('Property_URL', ''),
-                    'Address': prop.get('Address', ''),
-                    'Natural_Risks': prop.get('Natural_Risks', ''),
-                    'Natural_Risks_JSON': prop.get('Natural_Risks_JSON', ''),
-                    'Scraping_Date': prop.get('Scraping_Date', '')
-                })
-                
-                # Schools Card
-                schools_data.append({
-                    'Property_URL': prop.get('Property_URL', ''),
-                    'Address': prop.get('Address', ''),
-                    'Nearby_Schools_In_Catchment': prop.get('Nearby_Schools_In_Catchment', ''),
-                    'Nearby_Schools_All_Nearby': prop.get('Nearby_Schools_All_Nearby', ''),
-                    'Scraping_Date': prop.get('Scraping_Date', '')
-                })
-                
-                # Valuation Estimates Card
-                valuation_data.append({
-                    'Property_URL': prop.get('Property_URL', ''),
-                    'Address': prop.get('Address', ''),
-                    'Valuation_Estimate_Estimate': prop.get('Valuation_Estimate_Estimate', ''),
-                    'Valuation_Estimate_Estimate_JSON': prop.get('Valuation_Estimate_Estimate_JSON', ''),
-                    'Valuation_Estimate_Rental': prop.get('Valuation_Estimate_Rental', ''),
-                    'Valuation_Estimate_Rental_JSON': prop.get('Valuation_Estimate_Rental_JSON', ''),
-                    'Scraping_Date': prop.get('Scraping_Date', '')
-                })
-                
-                # Property History Card
-                property_history_data.append({
-                    'Property_URL': prop.get('Property_URL', ''),
-                    'Address': prop.get('Address', ''),
-                    'Property_History_All': prop.get('Property_History_All', ''),
-                    'Property_History_Sale': prop.get('Property_History_Sale', ''),
-                    'Property_History_Listing': prop.get('Property_History_Listing', ''),
-                    'Property_History_Rental': prop.get('Property_History_Rental', ''),
-                    'Property_History_DA': prop.get('Property_History_DA', ''),
-                    'Properties_Sold_12_Months': prop.get('Properties_Sold_12_Months', ''),
-                    'Scraping_Date': prop.get('Scraping_Date', '')
-                })
+            logger.info("💾 Saving data as %s...", SAVE_FORMAT)
             
-            # Save each card type to separate Excel files
-            card_files = {
-                'Property_Overview': property_overview_data,
-                'Sale_Rental_Info': sale_rental_data,
-                'Household_Info': household_data,
-                'Additional_Info': additional_info_data,
-                'Natural_Risks': natural_risks_data,
-                'Schools': schools_data,
-                'Valuation_Estimates': valuation_data,
-                'Property_History': property_history_data
-            }
+            df_all = pd.DataFrame(all_property_data).reindex(columns=list(_ROW_TEMPLATE), fill_value='')
+            save_cards(df_all, 'vic_property')
             
-            for card_name, card_data in card_files.items():
-                if card_data:
-                    df_card = pd.DataFrame(card_data)
-                    filename = f'vic_property_{card_name.lower()}.xlsx'
-                    df_card.to_excel(filename, index=False)
-                    print(f"✅ Saved {len(card_data)} records to {filename}")
-            
-            # Also save a master file with all data for reference
-            df_all = pd.DataFrame(all_property_data)
-            df_all.to_excel('vic_property_master.xlsx', index=False)
-            print(f"✅ Saved master file with all data to vic_property_master.xlsx")
-            
-            print(f"\n📊 Summary:")
-            print(f"  - Total properties processed: {len(all_property_data)}")
-            print(f"  - Card-specific files created: {len(card_files)}")
-            print(f"  - Master file created: vic_property_master.xlsx")
+            logger.info("📊 Summary:")
+            logger.info("  - Total properties processed: %d", len(all_property_data))
+            logger.info("  - Card-specific tables created: %d", len(CARD_COLUMNS))
+            logger.info("  - Master table created: vic_property (%s)", SAVE_FORMAT)
         else:
-            print("❌ No property data was successfully scraped")
+            logger.error("❌ No property data was successfully scraped")
             
     except Exception as e:
-        print(f"❌ Error during scraping process: {e}")
-    finally:
-        driver.quit()
-        print("🔚 Browser closed")
+        logger.error("❌ Error during scraping process: %s", e)
 
 def test_save_separate_files(all_property_data):
-    """Test function to save data to separate Excel files"""
+    """Test function to save data to the card tables"""
     if not all_property_data:
-        print("❌ No property data to save")
+        logger.error("❌ No property data to save")
         return
     
-    print(f"\n💾 Testing separate Excel file creation...")
+    logger.info("💾 Testing %s card table creation...", SAVE_FORMAT)
     
-    # Create separate data structures for each card
-    property_overview_data = []
-    sale_rental_data = []
-    household_data = []
-    additional_info_data = []
-    natural_risks_data = []
-    schools_data = []
-    valuation_data = []
-    property_history_data = []
+    df_all = pd.DataFrame(all_property_data).reindex(columns=list(_ROW_TEMPLATE), fill_value='')
+    save_cards(df_all, 'test_property')
     
-    for prop in all_property_data:
-        # Property Overview Card
-        property_overview_data.append({
-            'Property_URL': prop.get('Property_URL', ''),
-            'Address': prop.get('Address', ''),
-            'Property_Type': prop.get('Property_Type', ''),
-            'Land_Size': prop.get('Land_Size', ''),
-            'Floor_Area': prop.get('Floor_Area', ''),
-            'Bedrooms': prop.get('Bedrooms', ''),
-            'Bathrooms': prop.get('Bathrooms', ''),
-            'Car_Spaces': prop.get('Car_Spaces', ''),
-            'Scraping_Date': prop.get('Scraping_Date', '')
-        })
-        
-        # Sale/Rental Information Card
-        sale_rental_data.append({
-            'Property_URL': prop.get('Property_URL', ''),
-            'Address': prop.get('Address', ''),
-            'Last_Sold_Price': prop.get('Last_Sold_Price', ''),
-            'Last_Sold_Date': prop.get('Last_Sold_Date', ''),
-            'Sold_By': prop.get('Sold_By', ''),
-            'Land_Use': prop.get('Land_Use', ''),
-            'Issue_Date': prop.get('Issue_Date', ''),
-            'Advertisement_Date': prop.get('Advertisement_Date', ''),
-            'Listing_Description': prop.get('Listing_Description', ''),
-            'Advertising_Agent_Info_JSON': prop.get('Advertising_Agent_Info_JSON', ''),
-            'Sale_Information_JSON': prop.get('Sale_Information_JSON', ''),
-            'Scraping_Date': prop.get('Scraping_Date', '')
-        })
-        
-        # Household Information Card
-        household_data.append({
-            'Property_URL': prop.get('Property_URL', ''),
-            'Address': prop.get('Address', ''),
-            'Owner_Type': prop.get('Owner_Type', ''),
-            'Current_Tenure': prop.get('Current_Tenure', ''),
-            'Household_Information_Owner_Information': prop.get('Household_Information_Owner_Information', ''),
-            'Household_Information_Marketing_Contacts': prop.get('Household_Information_Marketing_Contacts', ''),
-            'Scraping_Date': prop.get('Scraping_Date', '')
-        })
-        
-        # Additional Information Card
-        additional_info_data.append({
-            'Property_URL': prop.get('Property_URL', ''),
-            'Address': prop.get('Address', ''),
-            'Additional_Information_Legal_Description': prop.get('Additional_Information_Legal_Description', ''),
-            'Additional_Information_Property_Features': prop.get('Additional_Information_Property_Features', ''),
-            'Additional_Information_Land_Values': prop.get('Additional_Information_Land_Values', ''),
-            'Scraping_Date': prop.get('Scraping_Date', '')
-        })
-        
-        # Natural Risks Card
-        natural_risks_data.append({
-            'Property_URL': prop.get('Property_URL', ''),
-            'Address': prop.get('Address', ''),
-            'Natural_Risks': prop.get('Natural_Risks', ''),
-            'Natural_Risks_JSON': prop.get('Natural_Risks_JSON', ''),
-            'Scraping_Date': prop.get('Scraping_Date', '')
-        })
-        
-        # Schools Card
-        schools_data.append({
-            'Property_URL': prop.get('Property_URL', ''),
-            'Address': prop.get('Address', ''),
-            'Nearby_Schools_In_Catchment': prop.get('Nearby_Schools_In_Catchment', ''),
-            'Nearby_Schools_All_Nearby': prop.get('Nearby_Schools_All_Nearby', ''),
-            'Scraping_Date': prop.get('Scraping_Date', '')
-        })
-        
-        # Valuation Estimates Card
-        valuation_data.append({
-            'Property_URL': prop.get('Property_URL', ''),
-            'Address': prop.get('Address', ''),
-            'Valuation_Estimate_Estimate': prop.get('Valuation_Estimate_Estimate', ''),
-            'Valuation_Estimate_Estimate_JSON': prop.get('Valuation_Estimate_Estimate_JSON', ''),
-            'Valuation_Estimate_Rental': prop.get('Valuation_Estimate_Rental', ''),
-            'Valuation_Estimate_Rental_JSON': prop.get('Valuation_Estimate_Rental_JSON', ''),
-            'Scraping_Date': prop.get('Scraping_Date', '')
-        })
-        
-        # Property History Card
-        property_history_data.append({
-            'Property_URL': prop.get('Property_URL', ''),
-            'Address': prop.get('Address', ''),
-            'Property_History_All': prop.get('Property_History_All', ''),
-            'Property_History_Sale': prop.get('Property_History_Sale', ''),
-            'Property_History_Listing': prop.get('Property_History_Listing', ''),
-            'Property_History_Rental': prop.get('Property_History_Rental', ''),
-            'Property_History_DA': prop.get('Property_History_DA', ''),
-            'Properties_Sold_12_Months': prop.get('Properties_Sold_12_Months', ''),
-            'Scraping_Date': prop.get('Scraping_Date', '')
-        })
-    
-    # Save each card type to separate Excel files
-    card_files = {
-        'Property_Overview': property_overview_data,
-        'Sale_Rental_Info': sale_rental_data,
-        'Household_Info': household_data,
-        'Additional_Info': additional_info_data,
-        'Natural_Risks': natural_risks_data,
-        'Schools': schools_data,
-        'Valuation_Estimates': valuation_data,
-        'Property_History': property_history_data
-    }
-    
-    for card_name, card_data in card_files.items():
-        if card_data:
-            df_card = pd.DataFrame(card_data)
-            filename = f'test_{card_name.lower()}.xlsx'
-            df_card.to_excel(filename, index=False)
-            print(f"✅ Test saved {len(card_data)} records to {filename}")
-    
-    # Also save a master file with all data for reference
-    df_all = pd.DataFrame(all_property_data)
-    df_all.to_excel('test_master.xlsx', index=False)
-    print(f"✅ Test saved master file with all data to test_master.xlsx")
-    
-    print(f"\n📊 Test Summary:")
-    print(f"  - Total properties processed: {len(all_property_data)}")
-    print(f"  - Card-specific files created: {len(card_files)}")
-    print(f"  - Master file created: test_master.xlsx")
+    logger.info("📊 Test Summary:")
+    logger.info("  - Total properties processed: %d", len(all_property_data))
+    logger.info("  - Card-specific tables created: %d", len(CARD_COLUMNS))
+    logger.info("  - Master table created: test_property (%s)", SAVE_FORMAT)
 
 def test_first_url():
     """Test function to debug the first URL specifically"""
-    print("🧪 Testing first URL specifically...")
+    logger.info("🧪 Testing first URL specifically...")
     
     # Read the CSV file with property URLs
     try:
@@ -1952,88 +1870,44 @@ def test_first_url():
         # urls = df_links['Property_URL'].dropna().tolist()
         urls=['https://rpp.corelogic.com.au/property/47-wellington-parade-south-east-melbourne-vic-3002/17241185']
         first_url = urls[0] if urls else None
-        print(f"📋 First URL: {first_url}")
+        logger.info("📋 First URL: %s", first_url)
     except Exception as e:
-        print(f"❌ Error reading vic_links.csv: {e}")
+        logger.error("❌ Error reading vic_links.csv: %s", e)
         return
     
     # Setup Chrome driver
-    options = Options()
-    options.add_experimental_option("detach", True)
-    driver = webdriver.Chrome(options=options)
-    driver.set_page_load_timeout(600)
-    driver.set_script_timeout(600)
+    # Keep the browser visible here so the page can be inspected after the test
+    driver = create_driver(headless=False)
     
     try:
-        # Login first
-        print("🔐 Starting login process...")
-        driver.get("https://rpp.corelogic.com.au/")
-        print("✅ Login page loaded")
-        
-        # Wait for page to fully load
-        time.sleep(29)
-        
-        # Check if we're already logged in
-        try:
-            current_url = driver.current_url
-            print(f"Current URL after login page load: {current_url}")
-            
-            # If we're redirected to a different page, we might already be logged in
-            if "login" not in current_url.lower() and "signin" not in current_url.lower():
-                print("✅ Already logged in or redirected to main page")
-            else:
-                print("🔐 Proceeding with login...")
-                
-                username_field = wait_until_present(driver, By.ID, "username", timeout=10)
-                username_field.clear()
-                username_field.send_keys("delpg2021")
-                print("✅ Username entered")
-                
-                password_field = wait_until_present(driver, By.ID, "password", timeout=10)
-                password_field.clear()
-                password_field.send_keys("FlatHead@2024")
-                print("✅ Password entered")
-                
-                sign_on_button = wait_until_clickable(driver, By.ID, "signOnButton", timeout=10)
-                sign_on_button.click()
-                print("✅ Login button clicked")
-                
-                # Wait for login to complete and check for redirect
-                time.sleep(30)
-                current_url = driver.current_url
-                print(f"URL after login attempt: {current_url}")
-                
-        except Exception as login_error:
-            print(f"⚠️ Login error: {login_error}")
-            print("Continuing anyway...")
-        
-        # Final wait to ensure we're ready
-        time.sleep(3)
+        login(driver, page_load_wait=29, login_wait=30)
         
         # Test the first URL
         if first_url:
-            print(f"\n🧪 Testing first URL: {first_url}")
+            logger.info("🧪 Testing first URL: %s", first_url)
             property_data = extract_property_data(driver, first_url)
             if property_data:
-                print("✅ First URL test successful!")
-                print(f"Address: {property_data.get('Address', 'N/A')}")
+                logger.info("✅ First URL test successful!")
+                logger.info("Address: %s", property_data.get('Address', 'N/A'))
                 
-                # Test saving to separate Excel files
-                print("\n💾 Testing separate Excel file creation...")
+                # Test saving the card tables
                 test_save_separate_files([property_data])
             else:
-                print("❌ First URL test failed!")
+                logger.error("❌ First URL test failed!")
         else:
-            print("❌ No URLs found in CSV")
+            logger.error("❌ No URLs found in CSV")
             
     except Exception as e:
-        print(f"❌ Error during test: {e}")
+        logger.error("❌ Error during test: %s", e)
     finally:
         input("Press Enter to close browser...")  # Keep browser open for inspection
         driver.quit()
-        print("🔚 Browser closed")
+        logger.info("🔚 Browser closed")
 
 if __name__ == "__main__":
+    # Plain messages on the console; set SCRAPER_LOG_LEVEL=DEBUG for selector-level detail or WARNING for problems only
+    logging.basicConfig(level=os.getenv("SCRAPER_LOG_LEVEL", "INFO").upper(), format="%(message)s")
+    
     # Uncomment the line below to test only the first URL
     # test_first_url()
     